@@ -0,0 +1,170 @@
+# backend/alerts.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from .models import db, Job, SavedSearch, SearchAlert
+
+MATCH_ALL = '*'
+GRAM = 3
+# Letters from most to least common in English; grams made of rarer
+# characters make more selective anchors.
+LETTER_FREQUENCY = 'etaoinshrdlcumwfgypbvkjxqz'
+TERM_CHUNK = 500
+ALERT_BATCH = 1000
+
+
+def _fold(text):
+    return (text or '').lower()
+
+
+def grams(text):
+    """All substrings of ``text`` up to ``GRAM`` characters long.
+
+    A search string of length n occurs in a text only if its grams of
+    length min(n, GRAM) all occur there, so one of them is a safe anchor.
+    """
+    return {text[i:i + n] for n in range(1, GRAM + 1) for i in range(len(text) - n + 1)}
+
+
+def _rarity(gram):
+    return sum(0 if ch.isspace() else
+               LETTER_FREQUENCY.index(ch) if ch in LETTER_FREQUENCY else len(LETTER_FREQUENCY)
+               for ch in gram)
+
+
+def choose_anchor(q, category, location):
+    """Pick the single term a saved search is indexed under.
+
+    Matching is substring-based like the listings page, so the anchor is one
+    character gram of a field (keyword first, as it is usually the most
+    selective), preferring grams of rare characters.  A job can only match
+    if it contains that gram in the same field.
+    """
+    for prefix, value in (('q:', q), ('c:', category), ('l:', location)):
+        value = _fold(value).strip()
+        if value:
+            n = min(len(value), GRAM)
+            candidates = {value[i:i + n] for i in range(len(value) - n + 1)}
+            return prefix + max(candidates, key=lambda g: (_rarity(g), g))
+    return MATCH_ALL
+
+
+def job_terms(job):
+    fields = (_fold(job.title), _fold(job.description), _fold(job.category), _fold(job.location))
+    title, description, category, location = fields
+    terms = ({'q:' + g for g in grams(title) | grams(description)}
+             | {'c:' + g for g in grams(category)}
+             | {'l:' + g for g in grams(location)} | {MATCH_ALL})
+    return terms, fields
+
+
+def matches(search, job_fields):
+    """The same test ``job_listings()`` applies with ``ilike``: each given
+    value is a case-insensitive substring of its field."""
+    title, description, category, location = job_fields
+    q = _fold(search.q).strip()
+    if q and q not in title and q not in description:
+        return False
+    wanted_category = _fold(search.category).strip()
+    if wanted_category and wanted_category not in category:
+        return False
+    wanted_location = _fold(search.location).strip()
+    return not wanted_location or wanted_location in location
+
+
+def match_job(job):
+    """Yield saved searches that match ``job``.
+
+    Only searches whose anchor gram occurs in the job are loaded (through
+    the ``saved_search.anchor`` index), so the cost follows the number of
+    candidates rather than the number of saved searches.
+    """
+    terms, fields = job_terms(job)
+    terms = sorted(terms)
+    for i in range(0, len(terms), TERM_CHUNK):
+        candidates = (
+            SavedSearch.query
+            .filter(SavedSearch.anchor.in_(terms[i:i + TERM_CHUNK]))
+            .yield_per(1000)
+        )
+        for search in candidates:
+            if matches(search, fields):
+                yield search
+
+
+def enqueue_alerts(job):
+    """Record alerts for every saved search matching ``job``, in batches."""
+    now = datetime.utcnow()
+    batch, total = [], 0
+    for search in match_job(job):
+        batch.append({
+            'saved_search_id': search.id,
+            'seeker_id': search.seeker_id,
+            'job_id': job.id,
+            'created_at': now,
+        })
+        if len(batch) >= ALERT_BATCH:
+            db.session.execute(insert(SearchAlert), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(SearchAlert), batch)
+        total += len(batch)
+    job.alerts_matched_at = now
+    db.session.commit()
+    return total
+
+
+def process_pending_jobs(limit=100):
+    """Match jobs that were posted but not yet matched (e.g. after a crash)."""
+    jobs = (
+        Job.query
+        .filter(Job.alerts_matched_at.is_(None), Job.is_active_clause())
+        .order_by(Job.id)
+        .limit(limit)
+        .all()
+    )
+    return sum(enqueue_alerts(job) for job in jobs), len(jobs)
+
+
+class AlertMatcher:
+    """Runs :func:`enqueue_alerts` off the request thread.
+
+    Jobs stay marked unmatched (``alerts_matched_at`` is NULL) until the
+    matcher finishes, so ``flask match-saved-searches`` can pick up anything
+    lost if the worker dies first.
+    """
+
+    def __init__(self):
+        self._app = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self._app = app
+        app.extensions['alert_matcher'] = self
+
+    def submit(self, job_id):
+        with self._lock:
+            if self._executor is None:
+                # Created lazily so each gunicorn worker gets its own thread.
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='alerts')
+        self._executor.submit(self._run, job_id)
+
+    def _run(self, job_id):
+        with self._app.app_context():
+            try:
+                job = db.session.get(Job, job_id)
+                if job is not None and job.alerts_matched_at is None:
+                    enqueue_alerts(job)
+            except Exception:
+                db.session.rollback()
+                self._app.logger.exception('Saved search matching failed for job %s', job_id)
+            finally:
+                db.session.remove()
+
+
+alert_matcher = AlertMatcher()
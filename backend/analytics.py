@@ -0,0 +1,165 @@
+# backend/analytics.py
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .models import (
+    db, Job, Application, ArchivedJob, ArchivedApplication,
+    JobDailyStats, CategoryDailyStats, StatusDailyStats
+)
+
+
+def _day(value):
+    return (value or datetime.utcnow()).date()
+
+
+def _bump(model, column, amount=1, keys=None, extra=None):
+    """Add ``amount`` to ``model.column`` for the row at ``keys``
+    (an SQLite upsert, so one statement and no read)."""
+    stmt = sqlite_insert(model).values(**keys, **(extra or {}), **{column: amount})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: model.__table__.c[column] + amount},
+    )
+    db.session.execute(stmt)
+
+
+# ---------- write-path hooks (call before commit) ----------
+def record_job_posted(job):
+    _bump(CategoryDailyStats, 'postings', keys={
+        'day': _day(job.posted_at),
+        'category': job.category or '',
+    })
+
+
+def record_job_recategorized(job, old_category):
+    # Jobs from before posted_at existed are not in the rollups (see
+    # rebuild_rollups), so there is nothing to move.
+    if job.posted_at is None or (old_category or '') == (job.category or ''):
+        return
+    day = _day(job.posted_at)
+    _bump(CategoryDailyStats, 'postings', -1, keys={'day': day, 'category': old_category or ''})
+    _bump(CategoryDailyStats, 'postings', 1, keys={'day': day, 'category': job.category or ''})
+
+
+def record_application(job_id, employer_id, applied_at=None):
+    day = _day(applied_at)
+    _bump(JobDailyStats, 'applications', keys={
+        'day': day, 'job_id': job_id,
+    }, extra={'employer_id': employer_id})
+    _bump(StatusDailyStats, 'count', keys={
+        'day': day, 'job_id': job_id, 'status': 'Applied',
+    }, extra={'employer_id': employer_id})
+
+
+def record_status_change(job_id, employer_id, old_status, new_status, applied_at=None):
+    """Move one application from ``old_status`` to ``new_status`` within
+    the day it was applied, so each application counts once, under its
+    current status (which is also what :func:`rebuild_rollups` derives).
+    Applications from before ``applied_at`` existed are not counted by
+    either, so they are skipped."""
+    if applied_at is None:
+        return
+    keys = {'day': _day(applied_at), 'job_id': job_id}
+    extra = {'employer_id': employer_id}
+    _bump(StatusDailyStats, 'count', -1, keys={**keys, 'status': old_status or 'Applied'}, extra=extra)
+    _bump(StatusDailyStats, 'count', 1, keys={**keys, 'status': new_status or 'Applied'}, extra=extra)
+
+
+# ---------- batch rebuild ----------
+def rebuild_rollups():
+    """Recompute every rollup from the raw and archived tables.
+
+    Used to backfill after upgrading or to repair drift.  The funnel counts
+    each application once, under its current status, on the day it was
+    applied, matching the incremental updates.
+    """
+    for model in (JobDailyStats, CategoryDailyStats, StatusDailyStats):
+        db.session.execute(delete(model))
+
+    sources = (
+        (Job, Application, Application.job_id, Job.id),
+        (ArchivedJob, ArchivedApplication, ArchivedApplication.archived_job_id, ArchivedJob.id),
+    )
+    for job_model, app_model, app_fk, job_pk in sources:
+        job_ref = job_model.id if job_model is Job else job_model.job_id
+        day = func.date(app_model.applied_at)
+        db.session.execute(insert(JobDailyStats).from_select(
+            ['day', 'job_id', 'employer_id', 'applications'],
+            select(day, job_ref, job_model.employer_id, func.count())
+            .select_from(app_model).join(job_model, app_fk == job_pk)
+            .where(app_model.applied_at.is_not(None))
+            .group_by(day, job_ref, job_model.employer_id)
+        ))
+        status = func.coalesce(app_model.status, 'Applied')
+        db.session.execute(insert(StatusDailyStats).from_select(
+            ['day', 'job_id', 'status', 'employer_id', 'count'],
+            select(day, job_ref, status, job_model.employer_id, func.count())
+            .select_from(app_model).join(job_model, app_fk == job_pk)
+            .where(app_model.applied_at.is_not(None))
+            .group_by(day, job_ref, status, job_model.employer_id)
+        ))
+
+    posted = (
+        select(func.date(Job.posted_at).label('day'),
+               func.coalesce(Job.category, '').label('category'))
+        .where(Job.posted_at.is_not(None))
+        .union_all(
+            select(func.date(ArchivedJob.posted_at),
+                   func.coalesce(ArchivedJob.category, ''))
+            .where(ArchivedJob.posted_at.is_not(None))
+        )
+        .subquery()
+    )
+    db.session.execute(insert(CategoryDailyStats).from_select(
+        ['day', 'category', 'postings'],
+        select(posted.c.day, posted.c.category, func.count())
+        .group_by(posted.c.day, posted.c.category)
+    ))
+    db.session.commit()
+
+
+# ---------- readers ----------
+def employer_summary(employer_id, days=30):
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
+    daily = db.session.execute(
+        select(JobDailyStats.day, func.sum(JobDailyStats.applications))
+        .where(JobDailyStats.employer_id == employer_id, JobDailyStats.day >= since)
+        .group_by(JobDailyStats.day)
+        .order_by(JobDailyStats.day)
+    ).all()
+    per_job = db.session.execute(
+        select(JobDailyStats.job_id, func.sum(JobDailyStats.applications).label('total'))
+        .where(JobDailyStats.employer_id == employer_id, JobDailyStats.day >= since)
+        .group_by(JobDailyStats.job_id)
+        .order_by(func.sum(JobDailyStats.applications).desc())
+    ).all()
+    funnel = db.session.execute(
+        select(StatusDailyStats.status, func.sum(StatusDailyStats.count))
+        .where(StatusDailyStats.employer_id == employer_id, StatusDailyStats.day >= since)
+        .group_by(StatusDailyStats.status)
+    ).all()
+    return {'since': since, 'daily': daily, 'per_job': per_job, 'funnel': funnel}
+
+
+def site_summary(days=30):
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
+    categories = db.session.execute(
+        select(CategoryDailyStats.category, func.sum(CategoryDailyStats.postings).label('total'))
+        .where(CategoryDailyStats.day >= since)
+        .group_by(CategoryDailyStats.category)
+        .order_by(func.sum(CategoryDailyStats.postings).desc())
+    ).all()
+    daily = db.session.execute(
+        select(JobDailyStats.day, func.sum(JobDailyStats.applications))
+        .where(JobDailyStats.day >= since)
+        .group_by(JobDailyStats.day)
+        .order_by(JobDailyStats.day)
+    ).all()
+    funnel = db.session.execute(
+        select(StatusDailyStats.status, func.sum(StatusDailyStats.count))
+        .where(StatusDailyStats.day >= since)
+        .group_by(StatusDailyStats.status)
+    ).all()
+    return {'since': since, 'categories': categories, 'daily': daily, 'funnel': funnel}
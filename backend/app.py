@@ -1,17 +1,117 @@
 # backend/app.py
+import csv
+import hmac
+import io
+import json
+import math
 import os
+import queue
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
 from functools import wraps
 
 from flask import (
-    Flask, render_template, request, redirect,
-    url_for, flash, session, send_from_directory
+    Flask, Response, jsonify, render_template, request, redirect,
+    url_for, flash, session, send_from_directory, stream_with_context
 )
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from .models import db, Admin, Employer, JobSeeker, Job, Application
+from . import analytics, dedup, geo
+from .alerts import alert_matcher, choose_anchor
+from .cli import register_cli
+from .counters import change_status
+from .metrics import DEFAULT_DIRECTORY as METRICS_DIR, request_metrics
+from .profiling import profiler
+from .submissions import (
+    active_jobs, claim_idempotency_key, store_idempotent_response, submit_applications
+)
+from .typeahead import FIELDS as TYPEAHEAD_FIELDS, job_values, typeahead
+from .events import (
+    broker, event_dict, events_since, format_sse, latest_event_id, record_status_event
+)
+from .models import (
+    APPLICATION_STATUSES, db, Admin, Employer, JobSeeker, Job, Application, ArchivedJob,
+    ArchivedApplication, SavedSearch, SearchAlert
+)
+
+PASSWORD_PATTERN = re.compile(
+    r"^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$"
+)
+
+# Application.id grows with submission time, so "newest"/"oldest" walk the
+# (job_id, status) index (which carries the rowid) without a sort step.
+APPLICANT_SORTS = {
+    'newest': Application.id.desc(),
+    'oldest': Application.id.asc(),
+    'name': JobSeeker.name.asc(),
+    'status': Application.status.asc(),
+}
+
+
+def applicants_query(job_id, status=None, sort='newest'):
+    query = (
+        db.session.query(Application, JobSeeker)
+        .join(JobSeeker, Application.seeker_id == JobSeeker.id)
+        .filter(Application.job_id == job_id)
+    )
+    if status:
+        query = query.filter(Application.status == status)
+    return query.order_by(APPLICANT_SORTS.get(sort, APPLICANT_SORTS['newest']))
+
+
+# Keyset columns (and direction) for each sort, ending in Application.id so
+# every row has a unique position to resume after.
+APPLICANT_KEYSETS = {
+    'newest': ((Application.id,), True),
+    'oldest': ((Application.id,), False),
+    'name': ((JobSeeker.name, Application.id), False),
+    'status': ((db.func.coalesce(Application.status, ''), Application.id), False),
+}
+
+
+def applicants_page(job_id, status=None, sort='newest', after=None, limit=500):
+    """Up to ``limit`` export rows following the keyset ``after``.
+
+    Rows are plain tuples (name, email, status, applied_at, resume, *key);
+    pass the trailing key of the last row as ``after`` to get the next page.
+    """
+    keys, descending = APPLICANT_KEYSETS.get(sort, APPLICANT_KEYSETS['newest'])
+    query = (
+        db.session.query(
+            JobSeeker.name, JobSeeker.email, Application.status,
+            Application.applied_at, JobSeeker.resume, *keys
+        )
+        .join(JobSeeker, Application.seeker_id == JobSeeker.id)
+        .filter(Application.job_id == job_id)
+    )
+    if status:
+        query = query.filter(Application.status == status)
+    if after is not None:
+        position, bound = db.tuple_(*keys), db.tuple_(*after)
+        query = query.filter(position < bound if descending else position > bound)
+    order = [key.desc() if descending else key.asc() for key in keys]
+    return query.order_by(*order).limit(limit).all()
+
 
+EXPORT_PAGE_SIZE = 500
 
-def create_app():
+
+def csv_safe(value):
+    # Stop spreadsheet apps from evaluating applicant-supplied text as formulas
+    text = '' if value is None else str(value)
+    return "'" + text if text[:1] in ('=', '+', '-', '@') else text
+
+
+def create_app(config=None):
+    """Build the Flask app without touching the database.
+
+    Schema creation and admin seeding live in the ``flask bootstrap``
+    command (see ``backend/cli.py``) so that gunicorn can preload this
+    factory once and fork workers that start serving immediately.
+    """
     base_dir = os.path.dirname(os.path.dirname(__file__))
 
     app = Flask(
@@ -32,7 +132,32 @@ def create_app():
 
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + db_path
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
+    app.config['JOB_TTL_DAYS'] = 30
+    app.config['ARCHIVE_PAGE_SIZE'] = 50
+    app.config['APPLICANTS_PAGE_SIZE'] = 50
+    app.config['BATCH_APPLY_LIMIT'] = 50
+    app.config['TYPEAHEAD_REFRESH'] = 300
+    app.config['TYPEAHEAD_MAX_TERMS'] = 50000
+    app.config['TYPEAHEAD_MAX_LENGTH'] = 60
+    app.config['MAX_SEARCH_RADIUS_KM'] = 500
+    app.config['MAX_SAVED_SEARCHES'] = 20
+    app.config['DEDUP_THRESHOLD'] = 0.7
+    app.config['SSE_POLL_INTERVAL'] = 1.0
+    app.config['SSE_KEEPALIVE'] = 15
+    app.config['SSE_MAX_STREAM_SECONDS'] = 300
+    # Streams held open per worker; keep below gunicorn's thread count so
+    # the remaining threads still serve ordinary requests.
+    app.config['SSE_MAX_STREAMS'] = int(os.environ.get('SSE_MAX_STREAMS', 24))
+    app.config['SSE_RETRY_AFTER'] = 30
+    app.config['PROFILE_DIR'] = os.path.join(tempfile.gettempdir(), 'job_board_profiles')
+    app.config['PROFILE_TOKEN'] = os.environ.get('PROFILE_TOKEN')
+    app.config['METRICS_DIR'] = METRICS_DIR
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+    app.config['BACKUP_DIR'] = os.environ.get('BACKUP_DIR') or os.path.join(base_dir, 'backups')
+    app.config['BACKUP_KEEP'] = 14
+
+    if config:
+        app.config.update(config)
 
     # -------------------------------
     # UPLOAD FOLDER CONFIGURATION
@@ -43,7 +168,15 @@ def create_app():
     if not os.path.exists(UPLOAD_FOLDER):
         os.makedirs(UPLOAD_FOLDER)
 
+    app.config.setdefault('MIGRATIONS_DIR', os.path.join(base_dir, 'migrations'))
+
     db.init_app(app)
+    broker.init_app(app)
+    typeahead.init_app(app)
+    alert_matcher.init_app(app)
+    profiler.init_app(app)
+    request_metrics.init_app(app)
+    register_cli(app)
 
     # ---------- auth helper ----------
     def login_required(role=None):
@@ -60,16 +193,12 @@ def create_app():
             return wrapper
         return decorator
 
-    # ---------- DB setup ----------
-    with app.app_context():
-        db.create_all()
-        if not Admin.query.filter_by(username='admin').first():
-            admin = Admin(
-                username='admin',
-                password=generate_password_hash('admin123')
-            )
-            db.session.add(admin)
-            db.session.commit()
+    def parse_expiry(raw):
+        # <input type="date"> value; the posting stays open through that day
+        day = datetime.strptime(raw, '%Y-%m-%d')
+        if day.date() < datetime.utcnow().date():
+            raise ValueError('expiry date is in the past')
+        return day + timedelta(days=1)
 
     # Serve uploaded resumes
     @app.route('/uploads/<filename>')
@@ -79,7 +208,7 @@ def create_app():
     # ---------- Public ----------
     @app.route('/')
     def index():
-        jobs = Job.query.order_by(Job.id.desc()).limit(5).all()
+        jobs = Job.active().order_by(Job.id.desc()).limit(5).all()
         return render_template('index.html', jobs=jobs)
 
     @app.route('/job-listings')
@@ -87,8 +216,14 @@ def create_app():
         q = request.args.get('q', '').strip()
         category = request.args.get('category', '').strip()
         location = request.args.get('location', '').strip()
+        near = request.args.get('near', '').strip()
+        show_duplicates = request.args.get('show_duplicates') == '1'
+        radius = request.args.get('radius', 25, type=float)
+        if not math.isfinite(radius):
+            radius = 25
+        radius = min(max(radius, 1), app.config['MAX_SEARCH_RADIUS_KM'])
 
-        query = Job.query
+        query = Job.active()
 
         if q:
             like = f"%{q}%"
@@ -99,16 +234,80 @@ def create_app():
             query = query.filter(Job.category.ilike(f"%{category}%"))
         if location:
             query = query.filter(Job.location.ilike(f"%{location}%"))
+        if not show_duplicates:
+            # Hide reposts while the job they duplicate is still listed.
+            canonical = db.aliased(Job)
+            query = query.filter(~db.exists().where(
+                canonical.id == Job.duplicate_of,
+                canonical.employer_id == Job.employer_id,
+                canonical.is_active_clause()
+            ))
+
+        origin = geo.geocode(near) if near else None
+        if near and origin is None:
+            flash(f'Unknown place "{near}"; showing all locations.', 'warning')
+
+        distances = {}
+        if origin:
+            # Grid cells narrow the scan to nearby rows via the geo_cell
+            # index; exact great-circle distance is applied in Python.
+            cells = geo.cells_within(origin[0], origin[1], radius)
+            query = query.filter(Job.geo_cell.isnot(None))
+            if cells is not None:
+                query = query.filter(Job.geo_cell.in_(cells))
+            jobs = []
+            for job in query.all():
+                d = geo.distance_km(origin[0], origin[1], job.latitude, job.longitude)
+                if d <= radius:
+                    distances[job.id] = d
+                    jobs.append(job)
+            jobs.sort(key=lambda job: (distances[job.id], -job.id))
+        else:
+            jobs = query.order_by(Job.id.desc()).all()
+
+        similar_counts = {}
+        if jobs and not show_duplicates:
+            canonical = db.aliased(Job)
+            similar_counts = dict(
+                db.session.query(Job.duplicate_of, db.func.count())
+                .join(canonical, canonical.id == Job.duplicate_of)
+                .filter(
+                    Job.duplicate_of.in_([job.id for job in jobs]),
+                    canonical.employer_id == Job.employer_id,
+                    Job.is_active_clause()
+                )
+                .group_by(Job.duplicate_of)
+                .all()
+            )
 
-        jobs = query.order_by(Job.id.desc()).all()
         return render_template(
             'job_listings.html',
             jobs=jobs,
             q=q,
             category=category,
-            location=location
+            location=location,
+            near=near,
+            radius=radius,
+            distances=distances,
+            show_duplicates=show_duplicates,
+            similar_counts=similar_counts
         )
 
+    @app.route('/api/typeahead')
+    def typeahead_suggestions():
+        field = request.args.get('field', 'title')
+        prefix = request.args.get('q', '')
+        limit = max(1, min(request.args.get('limit', 8, type=int), 10))
+
+        if field not in TYPEAHEAD_FIELDS:
+            return jsonify(success=False, message='Unknown field.'), 400
+        if not prefix.strip():
+            return jsonify(suggestions=[])
+
+        response = jsonify(suggestions=typeahead.suggest(field, prefix, limit))
+        response.headers['Cache-Control'] = 'public, max-age=60'
+        return response
+
     # ---------- Auth ----------
     @app.route('/register', methods=['GET', 'POST'])
     def register():
@@ -122,9 +321,7 @@ def create_app():
             # ------------------------------
             # PASSWORD VALIDATION
             # ------------------------------
-            import re
-            pattern = r"^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$"
-            if not re.match(pattern, password):
+            if not PASSWORD_PATTERN.match(password or ''):
                 flash(
                     "Password must be at least 8 characters long, contain 1 letter, 1 number, and 1 special character.",
                     "danger")
@@ -231,23 +428,68 @@ def create_app():
         job = Job.query.get_or_404(job_id)
         seeker_id = session['user_id']
 
-        existing = Application.query.filter_by(
-            job_id=job.id, seeker_id=seeker_id
-        ).first()
-        if existing:
+        if not job.is_active:
+            flash('This job is no longer accepting applications.', 'warning')
+            return redirect(url_for('job_listings'))
+
+        if not submit_applications(seeker_id, [job]):
+            db.session.rollback()
             flash('You already applied for this job.', 'warning')
             return redirect(url_for('job_listings'))
 
-        app_obj = Application(job_id=job.id, seeker_id=seeker_id, status='Applied')
-        db.session.add(app_obj)
         db.session.commit()
         flash('Application submitted.', 'success')
         return redirect(url_for('my_applications'))
 
+    @app.route('/api/applications/batch', methods=['POST'])
+    @login_required(role='seeker')
+    def apply_batch():
+        seeker_id = session['user_id']
+        payload = request.get_json(silent=True) or {}
+        job_ids = payload.get('job_ids')
+
+        if (not isinstance(job_ids, list) or not job_ids
+                or not all(isinstance(j, int) for j in job_ids)):
+            return jsonify(success=False, message='job_ids must be a non-empty list of ids.'), 400
+        if len(job_ids) > app.config['BATCH_APPLY_LIMIT']:
+            return jsonify(
+                success=False,
+                message=f"At most {app.config['BATCH_APPLY_LIMIT']} jobs per request."
+            ), 400
+
+        key = request.headers.get('Idempotency-Key', '')[:64]
+        if key:
+            stored = claim_idempotency_key(key, seeker_id, request.endpoint)
+            if stored is not None:
+                db.session.rollback()
+                if stored.endpoint != request.endpoint or stored.status_code is None:
+                    return jsonify(success=False, message='Idempotency-Key already used.'), 409
+                return Response(stored.response_body, status=stored.status_code,
+                                mimetype='application/json')
+
+        # Everything below runs in a single transaction.
+        job_ids = list(dict.fromkeys(job_ids))
+        jobs = active_jobs(job_ids)
+        inserted = submit_applications(seeker_id, jobs)
+        open_ids = {job.id for job in jobs}
+        body = {
+            'success': True,
+            'applied': [j for j in job_ids if j in inserted],
+            'already_applied': [j for j in job_ids if j in open_ids and j not in inserted],
+            'unavailable': [j for j in job_ids if j not in open_ids],
+        }
+        if key:
+            store_idempotent_response(key, seeker_id, 200, json.dumps(body))
+        db.session.commit()
+        return jsonify(body)
+
     @app.route('/my-applications')
     @login_required(role='seeker')
     def my_applications():
         seeker_id = session['user_id']
+        # Read before the applications, so the event stream replays any
+        # change committed after this point.
+        last_event_id = latest_event_id()
         applications = (
             Application.query
             .filter_by(seeker_id=seeker_id)
@@ -255,15 +497,158 @@ def create_app():
             .add_entity(Job)
             .all()
         )
-        return render_template('my_applications.html', applications=applications)
+        return render_template(
+            'my_applications.html',
+            applications=applications,
+            last_event_id=last_event_id
+        )
+
+    # Every open stream pins a worker thread, so their number is capped.
+    stream_slots = threading.BoundedSemaphore(app.config['SSE_MAX_STREAMS'])
+
+    @app.route('/my-applications/events')
+    @login_required(role='seeker')
+    def application_events():
+        seeker_id = session['user_id']
+        # EventSource sends Last-Event-ID on its own reconnects; a fresh
+        # EventSource (first connect, or after a 503) passes it in the URL.
+        last_id = request.headers.get('Last-Event-ID', type=int)
+        if last_id is None:
+            last_id = request.args.get('last_event_id', type=int)
+
+        if not stream_slots.acquire(blocking=False):
+            retry = app.config['SSE_RETRY_AFTER']
+            return Response(f'retry: {retry * 1000}\n\n', status=503, mimetype='text/event-stream',
+                            headers={'Retry-After': str(retry), 'Cache-Control': 'no-cache'})
+
+        # Subscribe before replaying so nothing committed in between is lost.
+        q = None
+        try:
+            q = broker.subscribe(seeker_id)
+            missed = events_since(seeker_id, last_id) if last_id is not None else []
+        except Exception:
+            if q is not None:
+                broker.unsubscribe(seeker_id, q)
+            stream_slots.release()
+            raise
+        last_id = last_id or 0
+        keepalive = app.config['SSE_KEEPALIVE']
+        deadline = time.monotonic() + app.config['SSE_MAX_STREAM_SECONDS']
+
+        def stream():
+            sent = last_id
+            try:
+                yield 'retry: 3000\n\n'
+                for event in missed:
+                    sent = event['id']
+                    yield format_sse(event)
+                # Streams end periodically; EventSource reconnects with
+                # Last-Event-ID, which frees the worker thread in between.
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        event = q.get(timeout=min(keepalive, remaining))
+                    except queue.Empty:
+                        yield ': keepalive\n\n'
+                        continue
+                    if event['id'] > sent:
+                        sent = event['id']
+                        yield format_sse(event)
+            finally:
+                broker.unsubscribe(seeker_id, q)
+
+        response = Response(stream(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        })
+        # The WSGI server always closes the response, even if the client
+        # goes away before the generator starts.
+        response.call_on_close(stream_slots.release)
+        return response
+
+    @app.route('/saved-searches')
+    @login_required(role='seeker')
+    def saved_searches():
+        seeker_id = session['user_id']
+        searches = (
+            SavedSearch.query
+            .filter_by(seeker_id=seeker_id)
+            .order_by(SavedSearch.id.desc())
+            .all()
+        )
+        alerts = (
+            db.session.query(SearchAlert, Job)
+            .join(Job, SearchAlert.job_id == Job.id)
+            .filter(SearchAlert.seeker_id == seeker_id, Job.is_active_clause())
+            .order_by(SearchAlert.id.desc())
+            .limit(50)
+            .all()
+        )
+        unseen = [alert.id for alert, _ in alerts if alert.seen_at is None]
+        if unseen:
+            SearchAlert.query.filter(SearchAlert.id.in_(unseen)).update(
+                {'seen_at': datetime.utcnow()}, synchronize_session=False
+            )
+            db.session.commit()
+        return render_template(
+            'saved_searches.html',
+            searches=searches,
+            alerts=alerts,
+            unseen=set(unseen)
+        )
+
+    @app.route('/saved-searches', methods=['POST'])
+    @login_required(role='seeker')
+    def save_search():
+        seeker_id = session['user_id']
+        q = request.form.get('q', '').strip()[:200]
+        category = request.form.get('category', '').strip()[:100]
+        location = request.form.get('location', '').strip()[:100]
+
+        if SavedSearch.query.filter_by(seeker_id=seeker_id).count() >= app.config['MAX_SAVED_SEARCHES']:
+            flash('You have reached the saved search limit.', 'warning')
+            return redirect(url_for('saved_searches'))
+
+        search = SavedSearch(
+            seeker_id=seeker_id,
+            q=q or None,
+            category=category or None,
+            location=location or None,
+            anchor=choose_anchor(q, category, location)
+        )
+        db.session.add(search)
+        db.session.commit()
+        flash("Search saved. We'll alert you about new matching jobs.", 'success')
+        return redirect(url_for('saved_searches'))
+
+    @app.route('/saved-searches/<int:search_id>/delete', methods=['POST'])
+    @login_required(role='seeker')
+    def delete_saved_search(search_id):
+        search = SavedSearch.query.get_or_404(search_id)
+        if search.seeker_id != session['user_id']:
+            flash('Unauthorized.', 'danger')
+            return redirect(url_for('saved_searches'))
+
+        SearchAlert.query.filter_by(saved_search_id=search.id).delete()
+        db.session.delete(search)
+        db.session.commit()
+        flash('Saved search deleted.', 'info')
+        return redirect(url_for('saved_searches'))
 
     # ---------- Employer ----------
     @app.route('/employer/jobs')
     @login_required(role='employer')
     def employer_jobs():
         employer_id = session['user_id']
-        jobs = Job.query.filter_by(employer_id=employer_id).all()
-        return render_template('employer_jobs.html', jobs=jobs)
+        jobs = (
+            Job.query
+            .filter_by(employer_id=employer_id, closed_at=None)
+            .order_by(Job.id.desc())
+            .all()
+        )
+        return render_template('employer_jobs.html', jobs=jobs, now=datetime.utcnow())
 
     @app.route('/employer/post-job', methods=['GET', 'POST'])
     @login_required(role='employer')
@@ -275,6 +660,7 @@ def create_app():
             location = request.form.get('location')
             salary_raw = request.form.get('salary')
             category = request.form.get('category')
+            expires_raw = request.form.get('expires_on')
 
             if not title:
                 flash('Title is required.', 'danger')
@@ -286,16 +672,32 @@ def create_app():
                 flash('Salary must be a number.', 'danger')
                 return redirect(url_for('employer_post_job'))
 
+            try:
+                if expires_raw:
+                    expires_at = parse_expiry(expires_raw)
+                else:
+                    expires_at = datetime.utcnow() + timedelta(days=app.config['JOB_TTL_DAYS'])
+            except ValueError:
+                flash('Expiry must be a valid date, today or later.', 'danger')
+                return redirect(url_for('employer_post_job'))
+
             job = Job(
                 title=title,
                 description=description,
                 location=location,
                 salary=salary,
                 category=category,
-                employer_id=employer_id
+                employer_id=employer_id,
+                expires_at=expires_at
             )
+            geo.locate_job(job)
             db.session.add(job)
+            db.session.flush()
+            dedup.index_job(job, app.config['DEDUP_THRESHOLD'])
+            analytics.record_job_posted(job)
             db.session.commit()
+            typeahead.job_added(job)
+            alert_matcher.submit(job.id)
             flash('Job posted.', 'success')
             return redirect(url_for('employer_jobs'))
 
@@ -312,11 +714,17 @@ def create_app():
             return redirect(url_for('employer_jobs'))
 
         if request.method == 'POST':
+            old_values = job_values(job)
+            old_category = job.category
+            old_text = dedup.job_text(job)
             job.title = request.form.get('title')
             job.description = request.form.get('description')
-            job.location = request.form.get('location')
+            if request.form.get('location') != job.location:
+                job.location = request.form.get('location')
+                geo.locate_job(job)
             job.category = request.form.get('category')
             salary_raw = request.form.get('salary')
+            expires_raw = request.form.get('expires_on')
 
             try:
                 job.salary = float(salary_raw) if salary_raw else None
@@ -324,7 +732,20 @@ def create_app():
                 flash('Salary must be a number.', 'danger')
                 return redirect(url_for('edit_job', job_id=job.id))
 
+            try:
+                # Re-saving an expired job's unchanged date is not an error.
+                if expires_raw and expires_raw != str(job.expires_on):
+                    job.expires_at = parse_expiry(expires_raw)
+            except ValueError:
+                flash('Expiry must be a valid date, today or later.', 'danger')
+                return redirect(url_for('edit_job', job_id=job.id))
+
+            analytics.record_job_recategorized(job, old_category)
+            if dedup.job_text(job) != old_text:
+                dedup.index_job(job, app.config['DEDUP_THRESHOLD'])
             db.session.commit()
+            if job.is_active:
+                typeahead.job_changed(old_values, job)
             flash('Job updated.', 'success')
             return redirect(url_for('employer_jobs'))
 
@@ -340,35 +761,128 @@ def create_app():
             flash('You can delete only your own jobs.', 'danger')
             return redirect(url_for('employer_jobs'))
 
-        Application.query.filter_by(job_id=job.id).delete()
-        db.session.delete(job)
+        # Closing is a single-row update; the job and its applications are
+        # moved to the archive tables by `flask archive-jobs`.  Applications
+        # stay attached until then, so the applicant counters need no change.
+        was_active = job.is_active
+        job.closed_at = datetime.utcnow()
         db.session.commit()
-        flash('Job deleted.', 'info')
+        if was_active:
+            typeahead.job_removed(job)
+        flash('Job closed. It will appear in your archive shortly.', 'info')
         return redirect(url_for('employer_jobs'))
 
-    @app.route('/employer/view-applications/<int:job_id>')
+    @app.route('/employer/archived-jobs')
     @login_required(role='employer')
-    def employer_view_applications(job_id):
+    def employer_archived_jobs():
         employer_id = session['user_id']
-        job = Job.query.get_or_404(job_id)
+        page = request.args.get('page', 1, type=int)
+        pagination = (
+            ArchivedJob.query
+            .filter_by(employer_id=employer_id)
+            .order_by(ArchivedJob.id.desc())
+            .paginate(page=page, per_page=app.config['ARCHIVE_PAGE_SIZE'], error_out=False)
+        )
+        return render_template('archived_jobs.html', pagination=pagination)
+
+    @app.route('/employer/archived-jobs/<int:archived_job_id>')
+    @login_required(role='employer')
+    def employer_archived_applications(archived_job_id):
+        employer_id = session['user_id']
+        job = ArchivedJob.query.get_or_404(archived_job_id)
 
         if job.employer_id != employer_id:
             flash('Unauthorized.', 'danger')
-            return redirect(url_for('employer_jobs'))
+            return redirect(url_for('employer_archived_jobs'))
 
         applications = (
-            Application.query
-            .filter_by(job_id=job.id)
+            ArchivedApplication.query
+            .filter_by(archived_job_id=job.id)
             .join(JobSeeker)
             .add_entity(JobSeeker)
             .all()
         )
         return render_template(
-            'employer_view_applications.html',
+            'archived_applications.html',
             job=job,
             applications=applications
         )
 
+    @app.route('/employer/view-applications/<int:job_id>')
+    @login_required(role='employer')
+    def employer_view_applications(job_id):
+        employer_id = session['user_id']
+        job = Job.query.get_or_404(job_id)
+
+        if job.employer_id != employer_id:
+            flash('Unauthorized.', 'danger')
+            return redirect(url_for('employer_jobs'))
+
+        status = request.args.get('status', '')
+        sort = request.args.get('sort', 'newest')
+        page = request.args.get('page', 1, type=int)
+
+        pagination = applicants_query(job.id, status, sort).paginate(
+            page=page,
+            per_page=app.config['APPLICANTS_PAGE_SIZE'],
+            error_out=False
+        )
+        return render_template(
+            'employer_view_applications.html',
+            job=job,
+            applications=pagination.items,
+            pagination=pagination,
+            statuses=APPLICATION_STATUSES,
+            sorts=APPLICANT_SORTS,
+            status=status,
+            sort=sort
+        )
+
+    @app.route('/employer/view-applications/<int:job_id>/export.csv')
+    @login_required(role='employer')
+    def export_applications(job_id):
+        employer_id = session['user_id']
+        job = Job.query.get_or_404(job_id)
+
+        if job.employer_id != employer_id:
+            flash('Unauthorized.', 'danger')
+            return redirect(url_for('employer_jobs'))
+
+        status = request.args.get('status', '')
+        sort = request.args.get('sort', 'newest')
+
+        # Each page is read in its own short transaction and the session is
+        # closed before the page is sent, so a slow download never holds
+        # SQLite's read lock (which would block every writer) between pages.
+        def generate():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(['Name', 'Email', 'Status', 'Applied At', 'Resume'])
+            after = None
+            while True:
+                rows = applicants_page(job.id, status, sort, after=after, limit=EXPORT_PAGE_SIZE)
+                db.session.close()
+                for name, email, app_status, applied_at, resume, *key in rows:
+                    writer.writerow([
+                        csv_safe(name),
+                        csv_safe(email),
+                        csv_safe(app_status),
+                        applied_at.isoformat() if applied_at else '',
+                        csv_safe(resume),
+                    ])
+                    after = key
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                if len(rows) < EXPORT_PAGE_SIZE:
+                    return
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename=job-{job.id}-applicants.csv'}
+        )
+
     @app.route('/employer/update-application/<int:application_id>', methods=['POST'])
     @login_required(role='employer')
     def update_application_status(application_id):
@@ -381,11 +895,52 @@ def create_app():
             return redirect(url_for('employer_jobs'))
 
         new_status = request.form.get('status', 'Under Review')
-        application.status = new_status
+        if new_status not in APPLICATION_STATUSES:
+            flash('Unknown application status.', 'danger')
+            return redirect(url_for('employer_view_applications', job_id=job.id))
+        old_status = application.status
+        if change_status(application, new_status):
+            analytics.record_status_change(
+                job.id, job.employer_id, old_status, new_status, application.applied_at
+            )
+        event = record_status_event(application)
         db.session.commit()
+        broker.publish(event_dict(event))
         flash('Application status updated.', 'success')
+        next_url = request.form.get('next', '')
+        if next_url.startswith('/') and not next_url.startswith('//'):
+            return redirect(next_url)
         return redirect(url_for('employer_view_applications', job_id=job.id))
 
+    @app.route('/employer/analytics')
+    @login_required(role='employer')
+    def employer_analytics():
+        employer_id = session['user_id']
+        days = max(1, min(request.args.get('days', 30, type=int), 365))
+        summary = analytics.employer_summary(employer_id, days=days)
+
+        # Rollups keep the original job id after archival, so look titles up
+        # among this employer's live jobs first, then their archived ones.
+        job_ids = [row.job_id for row in summary['per_job']]
+        titles = dict(
+            db.session.query(Job.id, Job.title)
+            .filter(Job.employer_id == employer_id, Job.id.in_(job_ids))
+            .all()
+        ) if job_ids else {}
+        archived_ids = [job_id for job_id in job_ids if job_id not in titles]
+        if archived_ids:
+            titles.update(
+                db.session.query(ArchivedJob.job_id, ArchivedJob.title)
+                .filter(ArchivedJob.employer_id == employer_id, ArchivedJob.job_id.in_(archived_ids))
+                .all()
+            )
+        return render_template(
+            'analytics.html',
+            days=days,
+            summary=summary,
+            titles=titles
+        )
+
     # ---------- Admin ----------
     @app.route('/admin/dashboard')
     @login_required(role='admin')
@@ -400,6 +955,7 @@ def create_app():
             'seeker_count': len(seekers),
             'job_count': len(jobs),
             'application_count': len(applications),
+            'archived_job_count': ArchivedJob.query.count(),
         }
 
         return render_template(
@@ -411,4 +967,100 @@ def create_app():
             applications=applications
         )
 
+    @app.route('/admin/analytics')
+    @login_required(role='admin')
+    def admin_analytics():
+        days = max(1, min(request.args.get('days', 30, type=int), 365))
+        return render_template(
+            'analytics.html',
+            days=days,
+            summary=analytics.site_summary(days=days)
+        )
+
+    @app.route('/admin/archived-jobs')
+    @login_required(role='admin')
+    def admin_archived_jobs():
+        page = request.args.get('page', 1, type=int)
+        pagination = (
+            ArchivedJob.query
+            .order_by(ArchivedJob.id.desc())
+            .paginate(page=page, per_page=app.config['ARCHIVE_PAGE_SIZE'], error_out=False)
+        )
+        return render_template('archived_jobs.html', pagination=pagination)
+
+    @app.route('/admin/profiling', methods=['GET', 'POST'])
+    @login_required(role='admin')
+    def admin_profiling():
+        if request.method == 'POST':
+            endpoint = request.form.get('endpoint', '')
+            percent = request.form.get('percent', 0, type=float)
+            if endpoint not in app.view_functions:
+                flash('Unknown endpoint.', 'danger')
+            elif not 0 <= percent <= 100:
+                flash('Sample rate must be between 0 and 100 percent.', 'danger')
+            else:
+                profiler.set_rule(endpoint, percent / 100)
+                flash('Profiling rule saved.', 'success')
+            return redirect(url_for('admin_profiling'))
+
+        return render_template(
+            'admin_profiling.html',
+            rules=profiler.rules(),
+            endpoints=sorted(app.view_functions),
+            results=profiler.endpoints(),
+            token_enabled=bool(profiler.token)
+        )
+
+    @app.route('/admin/profiling/reset', methods=['POST'])
+    @login_required(role='admin')
+    def admin_profiling_reset():
+        profiler.reset()
+        flash('Profiling results cleared.', 'success')
+        return redirect(url_for('admin_profiling'))
+
+    @app.route('/admin/profiling/<name>.pstats')
+    @login_required(role='admin')
+    def admin_profiling_pstats(name):
+        data = profiler.merged_pstats(name)
+        if data is None:
+            return 'No profile for this endpoint.', 404
+        return Response(
+            data,
+            mimetype='application/octet-stream',
+            headers={'Content-Disposition': f'attachment; filename="{name}.pstats"'}
+        )
+
+    @app.route('/admin/profiling/<name>.collapsed')
+    @login_required(role='admin')
+    def admin_profiling_collapsed(name):
+        return Response(profiler.merged_collapsed(name), mimetype='text/plain')
+
+    @app.route('/metrics')
+    def metrics():
+        # Endpoint names and traffic figures are internal: without a token
+        # configured the endpoint is off.
+        token = app.config['METRICS_TOKEN']
+        if not token:
+            return 'Not Found', 404
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return 'Unauthorized', 401
+        return Response(request_metrics.render(), mimetype='text/plain; version=0.0.4')
+
+    @app.route('/admin/archived-jobs/<int:archived_job_id>')
+    @login_required(role='admin')
+    def admin_archived_applications(archived_job_id):
+        job = ArchivedJob.query.get_or_404(archived_job_id)
+        applications = (
+            ArchivedApplication.query
+            .filter_by(archived_job_id=job.id)
+            .join(JobSeeker)
+            .add_entity(JobSeeker)
+            .all()
+        )
+        return render_template(
+            'archived_applications.html',
+            job=job,
+            applications=applications
+        )
+
     return app
@@ -0,0 +1,73 @@
+# backend/archive.py
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, insert, literal, not_, select
+
+from .models import db, Job, Application, ArchivedJob, ArchivedApplication, JobBand
+
+ARCHIVED_JOB_COLUMNS = (
+    'title', 'description', 'location', 'salary', 'category',
+    'employer_id', 'posted_at', 'expires_at', 'closed_at',
+)
+
+
+def archive_batch(batch_size=200, now=None):
+    """Move one batch of expired or closed jobs (and their applications)
+    into the archive tables.  Returns the number of jobs archived."""
+    now = now or datetime.utcnow()
+    jobs = (
+        Job.query
+        .filter(not_(Job.is_active_clause(now)))
+        .order_by(Job.id)
+        .limit(batch_size)
+        .all()
+    )
+    if not jobs:
+        return 0
+
+    job_ids = [job.id for job in jobs]
+    for job in jobs:
+        archived = ArchivedJob(
+            job_id=job.id,
+            archived_at=now,
+            **{name: getattr(job, name) for name in ARCHIVED_JOB_COLUMNS}
+        )
+        db.session.add(archived)
+        db.session.flush()
+
+        db.session.execute(
+            insert(ArchivedApplication).from_select(
+                ['archived_job_id', 'application_id', 'seeker_id', 'status', 'applied_at'],
+                select(
+                    literal(archived.id),
+                    Application.id,
+                    Application.seeker_id,
+                    Application.status,
+                    Application.applied_at,
+                ).where(Application.job_id == job.id)
+            )
+        )
+
+    db.session.execute(delete(Application).where(Application.job_id.in_(job_ids)))
+    db.session.execute(delete(JobBand).where(JobBand.job_id.in_(job_ids)))
+    db.session.execute(delete(Job).where(Job.id.in_(job_ids)))
+    db.session.commit()
+    db.session.expunge_all()
+    return len(job_ids)
+
+
+def archive_jobs(batch_size=200, pause=0.0):
+    """Archive until no expired or closed jobs remain.
+
+    Each batch is its own short transaction; ``pause`` sleeps between batches
+    so request handlers can grab the SQLite write lock in between.
+    """
+    total = 0
+    while True:
+        moved = archive_batch(batch_size)
+        total += moved
+        if moved < batch_size:
+            return total
+        if pause:
+            time.sleep(pause)
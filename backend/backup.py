@@ -0,0 +1,164 @@
+# backend/backup.py
+import glob
+import gzip
+import hashlib
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from urllib.parse import quote
+
+SNAPSHOT_PREFIX = 'job_board-'
+SNAPSHOT_SUFFIX = '.db.gz'
+CHUNK_SIZE = 1024 * 1024
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def online_copy(db_path, dest_path, pages=64, pause=0.005, max_restarts=20):
+    """Copy a live database with SQLite's online backup API.
+
+    Copies ``pages`` pages per step and sleeps ``pause`` seconds between
+    steps so the copy does not monopolise the disk.  In WAL mode the source
+    connection holds one read transaction for the whole copy: writers are
+    never blocked and the copy never restarts.  In rollback-journal mode the
+    read lock is dropped between steps so writers get in, but each write
+    from another connection restarts the copy; once that has happened
+    ``max_restarts`` times the rest is copied in one step, blocking writers
+    only for that step.  Returns the number of restarts.
+    """
+    # Read-only, so a missing file is an error instead of a new empty
+    # database that would be snapshotted (and counted as a good backup).
+    source = sqlite3.connect(f'file:{quote(os.path.abspath(db_path))}?mode=ro',
+                             uri=True, isolation_level=None)
+    try:
+        has_jobs = source.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job'"
+        ).fetchone()
+    except sqlite3.Error:
+        source.close()
+        raise
+    if not has_jobs:
+        source.close()
+        raise sqlite3.DatabaseError(f'{db_path} has no job table; is it the app database?')
+    target = sqlite3.connect(dest_path)
+    restarts = 0
+    last_remaining = None
+
+    def progress(status, remaining, total):
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            restarts += 1
+            if restarts > max_restarts:
+                raise _TooManyRestarts
+        last_remaining = remaining
+        if remaining and pause:
+            time.sleep(pause)
+
+    try:
+        wal = source.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        if wal:
+            source.execute('BEGIN')
+            source.execute('SELECT count(*) FROM sqlite_master').fetchone()
+        try:
+            source.backup(target, pages=pages, progress=progress)
+        except _TooManyRestarts:
+            source.backup(target, pages=-1)
+        if wal:
+            source.execute('COMMIT')
+        ok = target.execute('PRAGMA quick_check').fetchone()[0]
+        if ok != 'ok':
+            raise sqlite3.DatabaseError(f'Backup copy failed quick_check: {ok}')
+    finally:
+        target.close()
+        source.close()
+    return restarts
+
+
+def create_snapshot(db_path, backup_dir, pages=64, pause=0.005, now=None):
+    """Write a gzip-compressed snapshot plus a ``sha256sum``-style checksum
+    file to ``backup_dir`` and return the snapshot path."""
+    os.makedirs(backup_dir, exist_ok=True)
+    stamp = (now or datetime.utcnow()).strftime('%Y%m%dT%H%M%SZ')
+    name = f'{SNAPSHOT_PREFIX}{stamp}{SNAPSHOT_SUFFIX}'
+    path = os.path.join(backup_dir, name)
+    raw = os.path.join(backup_dir, f'.{name}.{os.getpid()}.db')
+    partial = path + '.partial'
+
+    try:
+        online_copy(db_path, raw, pages=pages, pause=pause)
+        with open(raw, 'rb') as src, gzip.open(partial, 'wb', compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        checksum = _sha256(partial)
+        with open(path + '.sha256', 'w') as f:
+            f.write(f'{checksum}  {name}\n')
+        os.replace(partial, path)
+    finally:
+        for leftover in (raw, partial):
+            if os.path.exists(leftover):
+                os.unlink(leftover)
+    return path
+
+
+def list_snapshots(backup_dir):
+    """Snapshot paths, oldest first (names sort by timestamp)."""
+    return sorted(glob.glob(os.path.join(backup_dir, f'{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}')))
+
+
+def verify_snapshot(path):
+    try:
+        with open(path + '.sha256') as f:
+            expected = f.read().split()[0]
+    except (OSError, IndexError):
+        return False
+    return _sha256(path) == expected
+
+
+def prune_snapshots(backup_dir, keep):
+    """Delete all but the newest ``keep`` snapshots.  Returns how many went."""
+    stale = list_snapshots(backup_dir)[:-keep] if keep > 0 else []
+    for path in stale:
+        for p in (path, path + '.sha256'):
+            if os.path.exists(p):
+                os.unlink(p)
+    return len(stale)
+
+
+def restore_snapshot(path, db_path):
+    """Replace the contents of ``db_path`` with a verified snapshot.
+
+    The decompressed copy is written back through the backup API rather
+    than by moving files, so SQLite's locking (and any WAL file) is
+    respected.  Stop the web and worker processes first: connections that
+    are mid-transaction will see their database change underneath them.
+    """
+    if not verify_snapshot(path):
+        raise ValueError(f'Checksum mismatch or missing checksum for {path}')
+    raw = os.path.join(os.path.dirname(os.path.abspath(db_path)), f'.restore.{os.getpid()}.db')
+    try:
+        with gzip.open(path, 'rb') as src, open(raw, 'wb') as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        source = sqlite3.connect(raw)
+        target = sqlite3.connect(db_path)
+        try:
+            ok = source.execute('PRAGMA quick_check').fetchone()[0]
+            if ok != 'ok':
+                raise sqlite3.DatabaseError(f'Snapshot failed quick_check: {ok}')
+            source.backup(target, pages=-1)
+        finally:
+            target.close()
+            source.close()
+    finally:
+        if os.path.exists(raw):
+            os.unlink(raw)
@@ -0,0 +1,244 @@
+import sqlite3
+import time
+
+import click
+from flask import current_app
+from sqlalchemy import inspect
+from werkzeug.security import generate_password_hash
+
+from .alerts import process_pending_jobs
+from .analytics import rebuild_rollups
+from .archive import archive_jobs
+from .backup import create_snapshot, list_snapshots, prune_snapshots, restore_snapshot
+from .counters import reconcile_counters
+from .dedup import index_job
+from .events import prune_events
+from .geo import locate_job
+from .submissions import prune_idempotency_keys
+from .models import db, Admin, Job
+
+# Databases created by the old ``db.create_all()`` boot path have no
+# ``alembic_version`` table; their schema matches this revision.
+LEGACY_REVISION = '4f1c2a9d7b30'
+
+
+def init_migrate(app):
+    if 'migrate' not in app.extensions:
+        from flask_migrate import Migrate
+        Migrate(app, db, directory=app.config['MIGRATIONS_DIR'],
+                render_as_batch=True)
+
+
+def seed_admin(username='admin', password='admin123'):
+    if Admin.query.filter_by(username=username).first():
+        return False
+    db.session.add(Admin(
+        username=username,
+        password=generate_password_hash(password)
+    ))
+    db.session.commit()
+    return True
+
+
+def schema_is_current():
+    from alembic.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    head = ScriptDirectory(current_app.config['MIGRATIONS_DIR']).get_current_head()
+    with db.engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision() == head
+
+
+def wait_for_schema(timeout=300, interval=2):
+    """Block until ``bootstrap`` has migrated the database to head.
+
+    Background commands can start alongside the web process on a fresh
+    deploy; they must not touch tables that do not exist yet.
+    """
+    deadline = time.monotonic() + timeout
+    while not schema_is_current():
+        if time.monotonic() >= deadline:
+            raise click.ClickException('Database is not migrated; run `flask bootstrap` first.')
+        time.sleep(interval)
+
+
+def bootstrap_database():
+    from flask_migrate import stamp, upgrade
+
+    init_migrate(current_app)
+    tables = inspect(db.engine).get_table_names()
+    if 'job' in tables and 'alembic_version' not in tables:
+        stamp(revision=LEGACY_REVISION)
+    upgrade()
+    seed_admin()
+    # WAL is a persistent property of the database file.  Readers no longer
+    # block writers, and `backup-db` can copy from one pinned read snapshot.
+    with db.engine.connect() as conn:
+        conn.exec_driver_sql('PRAGMA journal_mode=WAL')
+
+
+def register_cli(app):
+    # Alembic is only needed by CLI commands (``flask db ...``,
+    # ``flask bootstrap``); web workers skip importing it entirely.
+    if click.get_current_context(silent=True) is not None:
+        init_migrate(app)
+
+    @app.cli.command('bootstrap')
+    def bootstrap_command():
+        """Apply migrations and seed the default admin (run once per deploy)."""
+        bootstrap_database()
+        click.echo('Database is up to date.')
+
+    @app.cli.command('seed-admin')
+    @click.option('--username', default='admin')
+    @click.option('--password', default='admin123')
+    def seed_admin_command(username, password):
+        """Create an admin account if it does not exist yet."""
+        if seed_admin(username, password):
+            click.echo(f'Created admin {username!r}.')
+        else:
+            click.echo(f'Admin {username!r} already exists.')
+
+    @app.cli.command('archive-jobs')
+    @click.option('--batch-size', default=200, show_default=True)
+    @click.option('--pause', default=0.05, show_default=True,
+                  help='Seconds to sleep between batches.')
+    @click.option('--every', default=0, show_default=True,
+                  help='Keep running, archiving every N seconds.')
+    def archive_jobs_command(batch_size, pause, every):
+        """Move expired and closed jobs into the archive tables."""
+        wait_for_schema()
+        while True:
+            moved = archive_jobs(batch_size=batch_size, pause=pause)
+            click.echo(f'Archived {moved} job(s).')
+            if not every:
+                return
+            time.sleep(every)
+
+    @app.cli.command('backup-db')
+    @click.option('--pages', default=64, show_default=True,
+                  help='Database pages copied per backup step.')
+    @click.option('--pause', default=0.005, show_default=True,
+                  help='Seconds to sleep between steps so writers can run.')
+    @click.option('--keep', default=None, type=int,
+                  help='Snapshots to retain (default: BACKUP_KEEP).')
+    @click.option('--every', default=0, show_default=True,
+                  help='Keep running, taking a snapshot every N seconds.')
+    def backup_db_command(pages, pause, keep, every):
+        """Take a compressed, checksummed snapshot of the live database."""
+        backup_dir = current_app.config['BACKUP_DIR']
+        keep = current_app.config['BACKUP_KEEP'] if keep is None else keep
+        wait_for_schema()
+        while True:
+            started = time.monotonic()
+            try:
+                path = create_snapshot(db.engine.url.database, backup_dir, pages=pages, pause=pause)
+            except sqlite3.Error as e:
+                # Never prune after a failed run, so good snapshots survive.
+                if not every:
+                    raise click.ClickException(f'Backup failed: {e}')
+                click.echo(f'Backup failed: {e}', err=True)
+            else:
+                pruned = prune_snapshots(backup_dir, keep)
+                click.echo(f'Wrote {path} in {time.monotonic() - started:.1f}s; pruned {pruned} old snapshot(s).')
+            if not every:
+                return
+            time.sleep(every)
+
+    @app.cli.command('restore-db')
+    @click.argument('snapshot', required=False)
+    @click.option('--yes', is_flag=True, help='Do not ask for confirmation.')
+    def restore_db_command(snapshot, yes):
+        """Restore the database from SNAPSHOT (default: the newest one)."""
+        if snapshot is None:
+            snapshots = list_snapshots(current_app.config['BACKUP_DIR'])
+            if not snapshots:
+                raise click.ClickException('No snapshots found.')
+            snapshot = snapshots[-1]
+        db_path = db.engine.url.database
+        if not yes:
+            click.confirm(f'Overwrite {db_path} with {snapshot}? Stop the app first.', abort=True)
+        try:
+            restore_snapshot(snapshot, db_path)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo(f'Restored {db_path} from {snapshot}.')
+
+    @app.cli.command('reconcile-job-counters')
+    def reconcile_job_counters_command():
+        """Recompute per-job applicant counters and fix any that drifted."""
+        click.echo(f'Corrected {reconcile_counters()} counter value(s).')
+
+    @app.cli.command('prune-events')
+    @click.option('--max-age-hours', default=24, show_default=True)
+    def prune_events_command(max_age_hours):
+        """Delete application status events older than the SSE replay window."""
+        click.echo(f'Deleted {prune_events(max_age_hours)} event(s).')
+
+    @app.cli.command('rebuild-rollups')
+    def rebuild_rollups_command():
+        """Recompute the analytics rollup tables from raw data."""
+        rebuild_rollups()
+        click.echo('Analytics rollups rebuilt.')
+
+    @app.cli.command('prune-idempotency-keys')
+    @click.option('--max-age-hours', default=24, show_default=True)
+    def prune_idempotency_keys_command(max_age_hours):
+        """Forget stored responses for Idempotency-Key retries."""
+        click.echo(f'Deleted {prune_idempotency_keys(max_age_hours)} key(s).')
+
+    @app.cli.command('geocode-jobs')
+    @click.option('--all', 'all_jobs', is_flag=True,
+                  help='Re-geocode every job, not just ones without coordinates.')
+    @click.option('--batch-size', default=500, show_default=True)
+    def geocode_jobs_command(all_jobs, batch_size):
+        """Backfill job coordinates from the bundled gazetteer."""
+        last_id, located, total = 0, 0, 0
+        while True:
+            query = Job.query.filter(Job.id > last_id, Job.location.isnot(None))
+            if not all_jobs:
+                query = query.filter(Job.geo_cell.is_(None))
+            jobs = query.order_by(Job.id).limit(batch_size).all()
+            if not jobs:
+                break
+            for job in jobs:
+                located += locate_job(job) is not None
+            total += len(jobs)
+            last_id = jobs[-1].id
+            db.session.commit()
+        click.echo(f'Located {located} of {total} job(s).')
+
+    @app.cli.command('match-saved-searches')
+    @click.option('--batch-size', default=100, show_default=True)
+    def match_saved_searches_command(batch_size):
+        """Create alerts for jobs that were posted but never matched."""
+        alerts = jobs = 0
+        while True:
+            created, processed = process_pending_jobs(batch_size)
+            alerts += created
+            jobs += processed
+            if processed < batch_size:
+                break
+        click.echo(f'Matched {jobs} job(s), created {alerts} alert(s).')
+
+    @app.cli.command('dedup-jobs')
+    @click.option('--all', 'all_jobs', is_flag=True,
+                  help='Recompute every job, not just ones without a signature.')
+    @click.option('--batch-size', default=200, show_default=True)
+    def dedup_jobs_command(all_jobs, batch_size):
+        """Backfill MinHash signatures and flag near-duplicate jobs."""
+        # Oldest first, so reposts point at the original posting.
+        last_id, total, duplicates = 0, 0, 0
+        while True:
+            query = Job.query.filter(Job.id > last_id)
+            if not all_jobs:
+                query = query.filter(Job.minhash.is_(None))
+            jobs = query.order_by(Job.id).limit(batch_size).all()
+            if not jobs:
+                break
+            for job in jobs:
+                duplicates += index_job(job, app.config['DEDUP_THRESHOLD']) is not None
+            total += len(jobs)
+            last_id = jobs[-1].id
+            db.session.commit()
+        click.echo(f'Indexed {total} job(s); {duplicates} flagged as near-duplicates.')
@@ -0,0 +1,68 @@
+# backend/counters.py
+from sqlalchemy import func, select, update
+
+from .models import db, Application, Job, STATUS_COUNTERS
+
+
+def _adjust(job_id, **deltas):
+    """Add each delta to its ``Job`` column in a single relative UPDATE,
+    so concurrent writers cannot lose increments."""
+    values = {name: getattr(Job, name) + delta for name, delta in deltas.items() if delta}
+    if values:
+        db.session.execute(
+            update(Job).where(Job.id == job_id).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+
+# ---------- write-path hooks (call before commit) ----------
+def record_applications(job_ids, status='Applied'):
+    column = STATUS_COUNTERS.get(status)
+    for job_id in job_ids:
+        _adjust(job_id, applicant_count=1, **({column: 1} if column else {}))
+
+
+def change_status(application, new_status):
+    """Move ``application`` to ``new_status`` and shift the job's counters.
+
+    The UPDATE only matches while the row still has the status we read, so
+    two employers changing the same application at once cannot both move
+    it out of the old bucket.  Returns whether the status changed.
+    """
+    old_status = application.status
+    if new_status == old_status:
+        return False
+    result = db.session.execute(
+        update(Application)
+        .where(Application.id == application.id, Application.status == old_status)
+        .values(status=new_status)
+    )
+    if not result.rowcount:
+        return False
+    deltas = {}
+    if old_status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[old_status]] = -1
+    if new_status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[new_status]] = 1
+    _adjust(application.job_id, **deltas)
+    return True
+
+
+# ---------- maintenance ----------
+def reconcile_counters():
+    """Recompute every job's counters from ``application`` and fix those
+    that drifted.  Returns the number of counter values corrected."""
+    columns = {'applicant_count': None, **{c: s for s, c in STATUS_COUNTERS.items()}}
+    fixed = 0
+    for column, status in columns.items():
+        actual = select(func.count(Application.id)).where(Application.job_id == Job.id)
+        if status is not None:
+            actual = actual.where(Application.status == status)
+        actual = actual.scalar_subquery()
+        result = db.session.execute(
+            update(Job).where(getattr(Job, column) != actual).values({column: actual})
+            .execution_options(synchronize_session=False)
+        )
+        fixed += result.rowcount
+    db.session.commit()
+    return fixed
@@ -0,0 +1,111 @@
+# backend/dedup.py
+import hashlib
+import random
+import re
+import struct
+
+from sqlalchemy import delete, insert, select
+
+from .models import db, Job, JobBand
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS          # LSH candidate threshold ~ (1/16) ** (1/4) = 0.5
+SHINGLE_SIZE = 3
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(1729)        # fixed seed: signatures must be stable across processes
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+_SIGNATURE = struct.Struct(f'<{NUM_PERM}I')
+
+
+def _hash64(data):
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def shingles(text):
+    words = re.findall(r'\w+', (text or '').lower())
+    if len(words) < SHINGLE_SIZE:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def minhash(text):
+    hashes = [_hash64(s.encode()) for s in shingles(text)]
+    if not hashes:
+        return None
+    return [
+        min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+        for a, b in PERMUTATIONS
+    ]
+
+
+def pack(signature):
+    return _SIGNATURE.pack(*signature)
+
+
+def unpack(blob):
+    return _SIGNATURE.unpack(blob)
+
+
+def band_keys(signature):
+    """One signed 64-bit key per band, as stored in ``job_band.band_key``."""
+    keys = []
+    for band in range(BANDS):
+        chunk = struct.pack(f'<H{ROWS}I', band, *signature[band * ROWS:(band + 1) * ROWS])
+        keys.append(int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'little', signed=True))
+    return keys
+
+
+def similarity(sig_a, sig_b):
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def job_text(job):
+    return f'{job.title or ""}\n{job.description or ""}'
+
+
+def index_job(job, threshold=0.8):
+    """(Re)compute ``job``'s signature and LSH bands and flag it as a near
+    duplicate of the same employer's oldest sufficiently similar job.  The
+    caller commits; ``job`` must already have an id."""
+    db.session.execute(delete(JobBand).where(JobBand.job_id == job.id))
+
+    signature = minhash(job_text(job))
+    job.minhash = pack(signature) if signature else None
+    job.duplicate_of = None
+    if signature is None:
+        return None
+
+    keys = band_keys(signature)
+    candidate_ids = db.session.scalars(
+        select(JobBand.job_id)
+        .where(JobBand.band_key.in_(keys), JobBand.job_id != job.id)
+        .distinct()
+    ).all()
+    if candidate_ids:
+        candidates = (
+            db.session.query(Job.id, Job.minhash, Job.duplicate_of)
+            .filter(
+                Job.id.in_(candidate_ids),
+                # Other companies share boilerplate; only the same employer reposts.
+                Job.employer_id == job.employer_id,
+                Job.minhash.isnot(None)
+            )
+            .order_by(Job.id)
+            .all()
+        )
+        for candidate_id, blob, candidate_of in candidates:
+            if candidate_id < job.id and similarity(signature, unpack(blob)) >= threshold:
+                # Point at the root of the cluster so chains stay one level deep.
+                job.duplicate_of = candidate_of or candidate_id
+                break
+
+    db.session.execute(insert(JobBand), [
+        {'band_key': key, 'job_id': job.id} for key in set(keys)
+    ])
+    return job.duplicate_of
@@ -0,0 +1,175 @@
+import json
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, select
+
+from .models import db, ApplicationEvent
+
+
+def format_sse(event):
+    payload = json.dumps({
+        'application_id': event['application_id'],
+        'job_id': event['job_id'],
+        'status': event['status'],
+    })
+    return f"id: {event['id']}\nevent: status\ndata: {payload}\n\n"
+
+
+def event_dict(row):
+    return {
+        'id': row.id,
+        'seeker_id': row.seeker_id,
+        'application_id': row.application_id,
+        'job_id': row.job_id,
+        'status': row.status,
+    }
+
+
+class EventBroker:
+    """Per-process fan-out of application status events to SSE clients.
+
+    Writers insert an ``ApplicationEvent`` row in the same transaction as the
+    status change and call :meth:`publish` after commit, which reaches
+    subscribers in this worker immediately.  Other gunicorn workers pick the
+    row up from a single background thread that tails the ``application_event``
+    table, so the database sees one indexed query per worker per interval no
+    matter how many browsers are connected.
+    """
+
+    def __init__(self, poll_interval=1.0):
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+        self._published_here = deque(maxlen=1024)
+        self._last_id = None
+        self._thread = None
+        self._app = None
+
+    def init_app(self, app):
+        self._app = app
+        self.poll_interval = app.config.get('SSE_POLL_INTERVAL', self.poll_interval)
+        app.extensions['event_broker'] = self
+
+    # ---------- subscribers ----------
+    def subscribe(self, seeker_id):
+        q = queue.Queue(maxsize=100)
+        with self._lock:
+            self._subscribers[seeker_id].add(q)
+        self._ensure_tailer()
+        return q
+
+    def unsubscribe(self, seeker_id, q):
+        with self._lock:
+            subscribers = self._subscribers.get(seeker_id)
+            if subscribers is not None:
+                subscribers.discard(q)
+                if not subscribers:
+                    del self._subscribers[seeker_id]
+
+    def publish(self, event):
+        with self._lock:
+            self._published_here.append(event['id'])
+        self._deliver(event)
+
+    def _deliver(self, event):
+        with self._lock:
+            targets = list(self._subscribers.get(event['seeker_id'], ()))
+        for q in targets:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                # Slow client; it will resync from Last-Event-ID on reconnect.
+                pass
+
+    # ---------- cross-worker tailing ----------
+    def _ensure_tailer(self):
+        # Started lazily so it is created after gunicorn forks the worker.
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='event-broker', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        with self._app.app_context():
+            while True:
+                try:
+                    self._poll_once()
+                except Exception:
+                    self._app.logger.exception('Event broker poll failed')
+                finally:
+                    db.session.remove()
+                time.sleep(self.poll_interval)
+
+    def _poll_once(self):
+        if self._last_id is None:
+            self._last_id = db.session.scalar(select(func.max(ApplicationEvent.id))) or 0
+            return
+
+        with self._lock:
+            if not self._subscribers:
+                # Nobody listening in this worker; just advance the cursor.
+                self._last_id = db.session.scalar(
+                    select(func.max(ApplicationEvent.id))
+                ) or self._last_id
+                return
+
+        rows = db.session.execute(
+            select(ApplicationEvent)
+            .where(ApplicationEvent.id > self._last_id)
+            .order_by(ApplicationEvent.id)
+            .limit(500)
+        ).scalars().all()
+        for row in rows:
+            self._last_id = row.id
+            with self._lock:
+                if row.id in self._published_here:
+                    continue
+            self._deliver(event_dict(row))
+
+
+broker = EventBroker()
+
+
+def record_status_event(application):
+    """Stage an event row for ``application``'s new status; commit with it."""
+    event = ApplicationEvent(
+        seeker_id=application.seeker_id,
+        application_id=application.id,
+        job_id=application.job_id,
+        status=application.status,
+    )
+    db.session.add(event)
+    return event
+
+
+def latest_event_id():
+    return db.session.query(func.max(ApplicationEvent.id)).scalar() or 0
+
+
+def events_since(seeker_id, last_id, limit=100):
+    rows = (
+        ApplicationEvent.query
+        .filter(ApplicationEvent.seeker_id == seeker_id, ApplicationEvent.id > last_id)
+        .order_by(ApplicationEvent.id)
+        .limit(limit)
+        .all()
+    )
+    return [event_dict(row) for row in rows]
+
+
+def prune_events(max_age_hours=24):
+    cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+    result = db.session.execute(
+        delete(ApplicationEvent).where(ApplicationEvent.created_at < cutoff)
+    )
+    db.session.commit()
+    return result.rowcount
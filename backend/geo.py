@@ -0,0 +1,105 @@
+# backend/geo.py
+import csv
+import math
+import os
+import re
+from functools import lru_cache
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.csv')
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+# Grid buckets for radius search: 0.5 degree cells (~55 km north-south).
+CELL_DEGREES = 0.5
+CELL_COLUMNS = int(360 / CELL_DEGREES)
+MAX_CELLS = 2000
+
+
+def _normalize(text):
+    text = re.sub(r'[.]', '', (text or '').lower())
+    return ', '.join(part.strip() for part in text.split(',') if part.strip())
+
+
+@lru_cache(maxsize=1)
+def gazetteer():
+    """Map normalized place names to ``(lat, lon)`` from the bundled CSV.
+
+    Earlier rows win for ambiguous bare names, so the file lists the most
+    likely match first.
+    """
+    places = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            coords = (float(row['latitude']), float(row['longitude']))
+            names = [row['name']] + [a for a in row['aliases'].split('|') if a]
+            for name in names:
+                keys = [name, f"{name}, {row['country']}"]
+                if row['region']:
+                    keys += [f"{name}, {row['region']}",
+                             f"{name}, {row['region']}, {row['country']}"]
+                for key in keys:
+                    places.setdefault(_normalize(key), coords)
+    return places
+
+
+def geocode(location):
+    """Return ``(lat, lon)`` for a free-text location, or ``None``."""
+    key = _normalize(location)
+    if not key:
+        return None
+    places = gazetteer()
+    if key in places:
+        return places[key]
+    # "Austin, Texas, USA" -> try "austin, texas", then "austin"
+    parts = key.split(', ')
+    for end in range(len(parts) - 1, 0, -1):
+        coords = places.get(', '.join(parts[:end]))
+        if coords:
+            return coords
+    return None
+
+
+def cell_for(lat, lon):
+    row = int((lat + 90) // CELL_DEGREES)
+    col = int((lon + 180) // CELL_DEGREES) % CELL_COLUMNS
+    return row * CELL_COLUMNS + col
+
+
+def cells_within(lat, lon, radius_km):
+    """Grid cells overlapping the circle, or ``None`` if too many to list."""
+    dlat = radius_km / KM_PER_DEGREE
+    lat_min, lat_max = max(lat - dlat, -90.0), min(lat + dlat, 89.999)
+    widest = max(abs(lat_min), abs(lat_max))
+    cos_lat = math.cos(math.radians(widest))
+    if cos_lat < 1e-6 or radius_km / (KM_PER_DEGREE * cos_lat) >= 180:
+        cols = range(CELL_COLUMNS)
+    else:
+        dlon = radius_km / (KM_PER_DEGREE * cos_lat)
+        first = int((lon - dlon + 180) // CELL_DEGREES)
+        last = int((lon + dlon + 180) // CELL_DEGREES)
+        cols = [c % CELL_COLUMNS for c in range(first, last + 1)]
+
+    rows = range(int((lat_min + 90) // CELL_DEGREES), int((lat_max + 90) // CELL_DEGREES) + 1)
+    if len(rows) * len(cols) > MAX_CELLS:
+        return None
+    return [row * CELL_COLUMNS + col for row in rows for col in cols]
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def locate_job(job):
+    """Set ``job``'s coordinates and grid cell from its location text."""
+    coords = geocode(job.location)
+    if coords is None:
+        job.latitude = job.longitude = job.geo_cell = None
+    else:
+        job.latitude, job.longitude = coords
+        job.geo_cell = cell_for(*coords)
+    return coords
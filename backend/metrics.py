@@ -0,0 +1,215 @@
+# backend/metrics.py
+import glob
+import mmap
+import os
+import tempfile
+import threading
+import time
+import zlib
+
+from flask import g, request
+
+STATUS_CODES = (200, 201, 204, 301, 302, 304, 400, 401, 403, 404, 405, 409, 413, 429, 500, 502, 503)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED = 'unmatched'
+DEFAULT_DIRECTORY = os.environ.get('METRICS_DIR') or os.path.join(tempfile.gettempdir(), 'job_board_metrics')
+
+# One slot per endpoint, each a run of int64 cells:
+#   in-flight, one counter per status code plus "other", one counter per
+#   latency bucket plus +Inf, latency sum in microseconds.
+_IN_FLIGHT = 0
+_STATUS = 1
+_BUCKETS = _STATUS + len(STATUS_CODES) + 1
+_SUM = _BUCKETS + len(LATENCY_BUCKETS) + 1
+_SLOT = _SUM + 1
+_HEADER = 1   # layout fingerprint
+_CELL = 8
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class WorkerStore:
+    """A worker's counters in an mmap'd file under ``METRICS_DIR``.
+
+    Only the owning process writes its file, so updates need no
+    cross-process locking; the scrape endpoint sums every file.
+    """
+
+    def __init__(self, path, size, fingerprint):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, size * _CELL)
+            self._mmap = mmap.mmap(fd, size * _CELL)
+        finally:
+            os.close(fd)
+        self.cells = memoryview(self._mmap).cast('q')
+        self.cells[0] = fingerprint
+
+
+class RequestMetrics:
+    """Per-endpoint request counters, latency histograms and in-flight gauges.
+
+    Each gunicorn worker opens its own file the first time it serves a
+    request (after the fork), named after its pid.  Counters of exited
+    workers are kept so totals never go backwards; their in-flight gauges
+    are ignored.  ``gunicorn.conf.py`` clears the directory when the master
+    starts.
+    """
+
+    def __init__(self):
+        self.directory = None
+        self._endpoints = {}
+        self._fingerprint = 0
+        self._store = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.directory = app.config['METRICS_DIR']
+        app.extensions['metrics'] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    def _layout(self):
+        # Endpoints are only all registered once create_app() returns, so
+        # the layout is fixed on first use rather than in init_app().
+        if not self._endpoints:
+            from flask import current_app
+            names = sorted(current_app.view_functions) + [UNMATCHED]
+            self._fingerprint = zlib.crc32('\n'.join(names).encode())
+            self._endpoints = {name: i for i, name in enumerate(names)}
+        return self._endpoints
+
+    def _worker_store(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    os.makedirs(self.directory, exist_ok=True)
+                    size = _HEADER + len(self._layout()) * _SLOT
+                    self._store = WorkerStore(
+                        os.path.join(self.directory, f'metrics_{pid}.db'), size, self._fingerprint
+                    )
+                    self._pid = pid
+        return self._store
+
+    def _base(self, endpoint):
+        layout = self._layout()
+        return _HEADER + layout.get(endpoint, layout[UNMATCHED]) * _SLOT
+
+    # ---------- request hooks ----------
+    def _before_request(self):
+        cells = self._worker_store().cells
+        base = self._base(request.endpoint)
+        g._metrics = (base, time.perf_counter())
+        with self._lock:
+            cells[base + _IN_FLIGHT] += 1
+
+    def _after_request(self, response):
+        g._metrics_status = response.status_code
+        return response
+
+    def _teardown_request(self, exc):
+        state = g.pop('_metrics', None)
+        if state is None:
+            return
+        base, started = state
+        elapsed = time.perf_counter() - started
+        status = 500 if exc is not None else g.pop('_metrics_status', 500)
+        try:
+            status_index = STATUS_CODES.index(status)
+        except ValueError:
+            status_index = len(STATUS_CODES)
+        bucket = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if elapsed <= bound:
+                bucket = i
+                break
+        cells = self._store.cells
+        with self._lock:
+            cells[base + _IN_FLIGHT] -= 1
+            cells[base + _STATUS + status_index] += 1
+            cells[base + _BUCKETS + bucket] += 1
+            cells[base + _SUM] += int(elapsed * 1_000_000)
+
+    # ---------- exposition ----------
+    def collect(self):
+        """Sum every worker file into one list of cells per endpoint."""
+        layout = self._layout()
+        totals = [0] * (len(layout) * _SLOT)
+        for path in glob.glob(os.path.join(self.directory, 'metrics_*.db')):
+            try:
+                pid = int(os.path.basename(path)[len('metrics_'):-len('.db')])
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except (OSError, ValueError):
+                continue
+            if len(data) != (_HEADER + len(totals)) * _CELL:
+                continue
+            cells = memoryview(data).cast('q')
+            if cells[0] != self._fingerprint:
+                continue
+            alive = _pid_alive(pid)
+            for i in range(len(totals)):
+                if i % _SLOT == _IN_FLIGHT and not alive:
+                    continue
+                totals[i] += cells[_HEADER + i]
+        return {name: totals[i * _SLOT:(i + 1) * _SLOT] for name, i in layout.items()}
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        slots = self.collect()
+        lines = [
+            '# HELP http_requests_total Requests handled, by endpoint and status code.',
+            '# TYPE http_requests_total counter',
+        ]
+        for name, cells in slots.items():
+            for i, code in enumerate(STATUS_CODES + ('other',)):
+                if cells[_STATUS + i]:
+                    lines.append(f'http_requests_total{{endpoint="{name}",status="{code}"}} {cells[_STATUS + i]}')
+
+        lines += [
+            '# HELP http_request_duration_seconds Time from request start to teardown.',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        for name, cells in slots.items():
+            buckets = cells[_BUCKETS:_SUM]
+            count = sum(buckets)
+            if not count:
+                continue
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS + ('+Inf',), buckets):
+                cumulative += n
+                lines.append(f'http_request_duration_seconds_bucket{{endpoint="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_sum{{endpoint="{name}"}} {cells[_SUM] / 1_000_000}')
+            lines.append(f'http_request_duration_seconds_count{{endpoint="{name}"}} {count}')
+
+        lines += [
+            '# HELP http_requests_in_flight Requests currently being handled.',
+            '# TYPE http_requests_in_flight gauge',
+        ]
+        for name, cells in slots.items():
+            lines.append(f'http_requests_in_flight{{endpoint="{name}"}} {cells[_IN_FLIGHT]}')
+        return '\n'.join(lines) + '\n'
+
+
+def clear_directory(directory):
+    """Remove worker files left over from a previous server run."""
+    for path in glob.glob(os.path.join(directory, 'metrics_*.db')):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+request_metrics = RequestMetrics()
@@ -1,8 +1,17 @@
 # backend/models.py
+from datetime import datetime, timedelta
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import and_, or_
 
 db = SQLAlchemy()
 
+APPLICATION_STATUSES = ('Applied', 'Under Review', 'Shortlisted', 'Rejected')
+# ``Job`` counter column kept in step with each status (``backend.counters``)
+STATUS_COUNTERS = dict(zip(APPLICATION_STATUSES, (
+    'applied_count', 'under_review_count', 'shortlisted_count', 'rejected_count'
+)))
+
 
 class Admin(db.Model):
     __tablename__ = 'admin'
@@ -35,24 +44,203 @@ class JobSeeker(db.Model):
 
 class Job(db.Model):
     __tablename__ = 'job'
+    # Archival deletes rows; without AUTOINCREMENT SQLite would hand the
+    # highest deleted id to the next posting while rollups, alerts, events
+    # and ``duplicate_of`` still refer to it.
+    __table_args__ = {'sqlite_autoincrement': True}
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
     location = db.Column(db.String(100))
     salary = db.Column(db.Float)
     category = db.Column(db.String(100))
-    employer_id = db.Column(db.Integer, db.ForeignKey('employer.id'), nullable=False)
+    employer_id = db.Column(db.Integer, db.ForeignKey('employer.id'), nullable=False, index=True)
+    posted_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, index=True)
+    closed_at = db.Column(db.DateTime, index=True)
+    # Filled from the bundled gazetteer by ``backend.geo.locate_job``
+    latitude = db.Column(db.Float)
+    longitude = db.Column(db.Float)
+    geo_cell = db.Column(db.Integer, index=True)
+    alerts_matched_at = db.Column(db.DateTime)
+    # Near-duplicate detection (``backend.dedup``)
+    minhash = db.Column(db.LargeBinary)
+    duplicate_of = db.Column(db.Integer, index=True)
+    # Denormalized applicant counts (``backend.counters``)
+    applicant_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    applied_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    under_review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    shortlisted_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rejected_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     employer = db.relationship('Employer', back_populates='jobs', lazy=True)
     applications = db.relationship('Application', back_populates='job', lazy=True)
 
+    @classmethod
+    def is_active_clause(cls, now=None):
+        now = now or datetime.utcnow()
+        return and_(
+            cls.closed_at.is_(None),
+            or_(cls.expires_at.is_(None), cls.expires_at > now),
+        )
+
+    @classmethod
+    def active(cls):
+        """Query over postings that are still open; archival removes the rest."""
+        return cls.query.filter(cls.is_active_clause())
+
+    @property
+    def expires_on(self):
+        """Last calendar day (UTC) on which the posting is open."""
+        if self.expires_at is None:
+            return None
+        return (self.expires_at - timedelta(microseconds=1)).date()
+
+    @property
+    def is_active(self):
+        if self.closed_at is not None:
+            return False
+        return self.expires_at is None or self.expires_at > datetime.utcnow()
+
 
 class Application(db.Model):
     __tablename__ = 'application'
+    __table_args__ = (
+        db.Index('ix_application_job_id_status', 'job_id', 'status'),
+        db.Index('uq_application_job_id_seeker_id', 'job_id', 'seeker_id', unique=True),
+        # Ids are never reused after archival (see ``Job``)
+        {'sqlite_autoincrement': True},
+    )
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, db.ForeignKey('job.id'), nullable=False)
     seeker_id = db.Column(db.Integer, db.ForeignKey('job_seeker.id'), nullable=False)
     status = db.Column(db.String(50), default='Applied')
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     job = db.relationship('Job', back_populates='applications', lazy=True)
     seeker = db.relationship('JobSeeker', back_populates='applications', lazy=True)
+
+
+# ---------- Archive ----------
+# Expired and closed jobs are moved here by ``backend.archive`` so the hot
+# ``job``/``application`` tables only hold live postings.  Archive rows get
+# their own ids because SQLite may reuse the ids of deleted ``job`` rows.
+class ArchivedJob(db.Model):
+    __tablename__ = 'job_archive'
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, nullable=False, index=True)
+    title = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text)
+    location = db.Column(db.String(100))
+    salary = db.Column(db.Float)
+    category = db.Column(db.String(100))
+    employer_id = db.Column(db.Integer, db.ForeignKey('employer.id'), nullable=False, index=True)
+    posted_at = db.Column(db.DateTime)
+    expires_at = db.Column(db.DateTime)
+    closed_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    employer = db.relationship('Employer', lazy=True)
+    applications = db.relationship('ArchivedApplication', back_populates='job', lazy=True)
+
+
+class ArchivedApplication(db.Model):
+    __tablename__ = 'application_archive'
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False)
+    archived_job_id = db.Column(db.Integer, db.ForeignKey('job_archive.id'), nullable=False, index=True)
+    seeker_id = db.Column(db.Integer, db.ForeignKey('job_seeker.id'), nullable=False)
+    status = db.Column(db.String(50))
+    applied_at = db.Column(db.DateTime)
+
+    job = db.relationship('ArchivedJob', back_populates='applications', lazy=True)
+    seeker = db.relationship('JobSeeker', lazy=True)
+
+
+# ---------- Events ----------
+# Change table tailed by every worker's ``EventBroker`` to push application
+# status updates to connected seekers over Server-Sent Events.
+class ApplicationEvent(db.Model):
+    __tablename__ = 'application_event'
+    id = db.Column(db.Integer, primary_key=True)
+    seeker_id = db.Column(db.Integer, nullable=False, index=True)
+    application_id = db.Column(db.Integer, nullable=False)
+    job_id = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(50))
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+# ---------- Analytics rollups ----------
+# Maintained incrementally by ``backend.analytics`` in the same transaction
+# as the write they count; analytics pages read only these tables.
+class JobDailyStats(db.Model):
+    __tablename__ = 'job_daily_stats'
+    day = db.Column(db.Date, primary_key=True)
+    job_id = db.Column(db.Integer, primary_key=True)
+    employer_id = db.Column(db.Integer, nullable=False, index=True)
+    applications = db.Column(db.Integer, nullable=False, default=0)
+
+
+class CategoryDailyStats(db.Model):
+    __tablename__ = 'category_daily_stats'
+    day = db.Column(db.Date, primary_key=True)
+    category = db.Column(db.String(100), primary_key=True)
+    postings = db.Column(db.Integer, nullable=False, default=0)
+
+
+class StatusDailyStats(db.Model):
+    """Applications per job, day applied and current status (the hiring funnel)."""
+    __tablename__ = 'status_daily_stats'
+    day = db.Column(db.Date, primary_key=True)
+    job_id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(50), primary_key=True)
+    employer_id = db.Column(db.Integer, nullable=False, index=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+
+# ---------- Idempotency ----------
+# Responses of retried API requests, keyed by the client's Idempotency-Key.
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_key'
+    key = db.Column(db.String(64), primary_key=True)
+    user_id = db.Column(db.Integer, primary_key=True)
+    endpoint = db.Column(db.String(100), nullable=False)
+    status_code = db.Column(db.Integer)
+    response_body = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+# ---------- Saved searches ----------
+class SavedSearch(db.Model):
+    __tablename__ = 'saved_search'
+    id = db.Column(db.Integer, primary_key=True)
+    seeker_id = db.Column(db.Integer, db.ForeignKey('job_seeker.id'), nullable=False, index=True)
+    q = db.Column(db.String(200))
+    category = db.Column(db.String(100))
+    location = db.Column(db.String(100))
+    # Reverse index: the one character gram a job must contain to be a
+    # candidate (see ``backend.alerts.choose_anchor``).
+    anchor = db.Column(db.String(120), nullable=False, index=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class SearchAlert(db.Model):
+    __tablename__ = 'search_alert'
+    __table_args__ = (
+        db.Index('ix_search_alert_seeker_id_id', 'seeker_id', 'id'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    saved_search_id = db.Column(db.Integer, nullable=False, index=True)
+    seeker_id = db.Column(db.Integer, nullable=False)
+    job_id = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    seen_at = db.Column(db.DateTime)
+
+
+# ---------- Near-duplicate index ----------
+# LSH band buckets over each job's MinHash signature; jobs sharing any
+# band_key are candidates for near-duplicate comparison.
+class JobBand(db.Model):
+    __tablename__ = 'job_band'
+    band_key = db.Column(db.BigInteger, primary_key=True)
+    job_id = db.Column(db.Integer, primary_key=True, index=True)
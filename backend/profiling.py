@@ -0,0 +1,253 @@
+# backend/profiling.py
+import cProfile
+import glob
+import hmac
+import json
+import os
+import pstats
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+from flask import g, request
+
+RULES_FILE = 'rules.json'
+RULES_RECHECK_SECONDS = 1.0
+
+
+def _safe_name(endpoint):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', endpoint)
+
+
+class StackSampler:
+    """Samples the Python stacks of registered threads at a fixed interval.
+
+    Produces full call stacks (which cProfile cannot), for flamegraphs.  The
+    sampling thread only runs while at least one request is being profiled.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._threads = {}   # thread ident -> Counter of collapsed stacks
+        self._runner = None
+
+    def start(self, ident):
+        counter = Counter()
+        with self._lock:
+            self._threads[ident] = counter
+            if self._runner is None or not self._runner.is_alive():
+                self._runner = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._runner.start()
+        return counter
+
+    def stop(self, ident):
+        with self._lock:
+            return self._threads.pop(ident, Counter())
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._threads:
+                    self._runner = None
+                    return
+                targets = list(self._threads.items())
+            frames = sys._current_frames()
+            for ident, counter in targets:
+                frame = frames.get(ident)
+                if frame is not None:
+                    counter[self._collapse(frame)] += 1
+            time.sleep(self.interval)
+
+    @staticmethod
+    def _collapse(frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+
+
+class RequestProfiler:
+    """Opt-in per-endpoint profiling shared by every worker.
+
+    Admins set a sampling rate per endpoint; rules live in ``PROFILE_DIR`` so
+    all gunicorn workers see them.  A request is also profiled when it sends
+    ``X-Profile-Token`` matching ``PROFILE_TOKEN``.  Each worker writes its
+    aggregated pstats and collapsed stacks to ``PROFILE_DIR`` after every
+    profiled request, and downloads merge the files of all workers.  With
+    no rules and no token header, the per-request cost is a dict lookup.
+    """
+
+    def __init__(self):
+        self.directory = None
+        self.token = None
+        self.sampler = StackSampler()
+        self._rules = {}
+        self._epoch = 0
+        self._rules_checked = 0.0
+        self._rules_mtime = None
+        self._lock = threading.Lock()
+        # cProfile hooks are process-wide on Python 3.12+, so concurrent
+        # profiled requests fall back to stack samples only.
+        self._cprofile_lock = threading.Lock()
+        self._stats = {}
+        self._stacks = defaultdict(Counter)
+
+    def init_app(self, app):
+        self.directory = app.config['PROFILE_DIR']
+        self.token = app.config.get('PROFILE_TOKEN')
+        self.sampler.interval = app.config.get('PROFILE_SAMPLE_INTERVAL', self.sampler.interval)
+        app.extensions['profiler'] = self
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    # ---------- rules ----------
+    @property
+    def _rules_path(self):
+        return os.path.join(self.directory, RULES_FILE)
+
+    def rules(self):
+        now = time.monotonic()
+        if now - self._rules_checked >= RULES_RECHECK_SECONDS:
+            self._rules_checked = now
+            try:
+                mtime = os.stat(self._rules_path).st_mtime
+            except OSError:
+                mtime = None
+            if mtime != self._rules_mtime:
+                self._rules_mtime = mtime
+                self._rules, epoch = self._read_state()
+                if epoch != self._epoch:
+                    self._epoch = epoch
+                    with self._lock:
+                        self._stats.clear()
+                        self._stacks.clear()
+        return self._rules
+
+    def _read_state(self):
+        try:
+            with open(self._rules_path) as f:
+                state = json.load(f)
+            return {k: float(v) for k, v in state['rules'].items()}, int(state['epoch'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, 0
+
+    def _write_state(self, rules, epoch):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self._rules_path + f'.{os.getpid()}'
+        with open(tmp, 'w') as f:
+            json.dump({'rules': rules, 'epoch': epoch}, f)
+        os.replace(tmp, self._rules_path)
+        self._rules_checked = 0.0
+
+    def set_rule(self, endpoint, rate):
+        rules, epoch = self._read_state()
+        if rate > 0:
+            rules[endpoint] = min(rate, 1.0)
+        else:
+            rules.pop(endpoint, None)
+        self._write_state(rules, epoch)
+
+    # ---------- request hooks ----------
+    def _wants_profile(self):
+        header = request.headers.get('X-Profile-Token')
+        if header and self.token and hmac.compare_digest(header, self.token):
+            return True
+        rate = self.rules().get(request.endpoint)
+        return rate is not None and random.random() < rate
+
+    def _before_request(self):
+        if not self.rules() and 'X-Profile-Token' not in request.headers:
+            return
+        if request.endpoint and self._wants_profile():
+            profile = None
+            if self._cprofile_lock.acquire(blocking=False):
+                profile = cProfile.Profile()
+            g._profile = (request.endpoint, profile)
+            self.sampler.start(threading.get_ident())
+            if profile is not None:
+                profile.enable()
+
+    def _teardown_request(self, exc):
+        state = g.pop('_profile', None)
+        if state is None:
+            return
+        endpoint, profile = state
+        if profile is not None:
+            profile.disable()
+            self._cprofile_lock.release()
+        stacks = self.sampler.stop(threading.get_ident())
+        self._record(endpoint, profile, stacks)
+
+    def _record(self, endpoint, profile, stacks):
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            base = os.path.join(self.directory, f'{_safe_name(endpoint)}.{os.getpid()}')
+            if profile is not None:
+                stats = self._stats.get(endpoint)
+                if stats is None:
+                    stats = self._stats[endpoint] = pstats.Stats(profile)
+                else:
+                    stats.add(profile)
+                stats.dump_stats(base + '.pstats')
+            self._stacks[endpoint].update(stacks)
+            with open(base + '.collapsed', 'w') as f:
+                f.writelines(f'{stack} {count}\n' for stack, count in self._stacks[endpoint].items())
+
+    # ---------- results ----------
+    def _files(self, endpoint, suffix):
+        return sorted(glob.glob(os.path.join(self.directory, f'{glob.escape(_safe_name(endpoint))}.*{suffix}')))
+
+    def endpoints(self):
+        names = set()
+        for path in glob.glob(os.path.join(self.directory, '*.pstats')) + \
+                glob.glob(os.path.join(self.directory, '*.collapsed')):
+            names.add(os.path.basename(path).rsplit('.', 2)[0])
+        return sorted(names)
+
+    def merged_pstats(self, endpoint):
+        files = self._files(endpoint, '.pstats')
+        if not files:
+            return None
+        stats = pstats.Stats(files[0])
+        for path in files[1:]:
+            stats.add(path)
+        with tempfile.NamedTemporaryFile(suffix='.pstats', delete=False) as f:
+            path = f.name
+        try:
+            stats.dump_stats(path)
+            with open(path, 'rb') as f:
+                return f.read()
+        finally:
+            os.unlink(path)
+
+    def merged_collapsed(self, endpoint):
+        totals = Counter()
+        for path in self._files(endpoint, '.collapsed'):
+            with open(path) as f:
+                for line in f:
+                    stack, _, count = line.rstrip('\n').rpartition(' ')
+                    if stack:
+                        totals[stack] += int(count)
+        return ''.join(f'{stack} {count}\n' for stack, count in totals.most_common())
+
+    def reset(self):
+        """Discard results everywhere; other workers notice the new epoch."""
+        rules, epoch = self._read_state()
+        self._write_state(rules, epoch + 1)
+        self.rules()
+        for path in glob.glob(os.path.join(self.directory, '*.pstats')) + \
+                glob.glob(os.path.join(self.directory, '*.collapsed')):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+profiler = RequestProfiler()
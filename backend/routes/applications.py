@@ -3,6 +3,7 @@ from flask import Blueprint, jsonify, current_app
 from flask_login import login_required, current_user
 from ..app import db
 from ..models import Application, Job, JobSeeker
+from ..submissions import submit_applications
 
 applications_bp = Blueprint('applications', __name__, url_prefix='/applications')
 
@@ -13,18 +14,13 @@ def apply(job_id):
     if not isinstance(current_user, JobSeeker):
         return jsonify(success=False, message="Only job seekers can apply"), 403
 
-    # Check if already applied
-    existing = Application.query.filter_by(
-        job_id=job_id,
-        seeker_id=current_user.id
-    ).first()
+    job = Job.query.get_or_404(job_id)
 
-    if existing:
+    # Insert unless already applied (unique job_id/seeker_id index)
+    if not submit_applications(current_user.id, [job]):
+        db.session.rollback()
         return jsonify(success=False, message="You have already applied for this job")
 
-    # Create new application
-    application = Application(job_id=job_id, seeker_id=current_user.id, status="Applied")
-    db.session.add(application)
     db.session.commit()
 
     return jsonify(success=True, message="Application submitted successfully!")
@@ -45,5 +41,5 @@ def my_applications():
         'title': a.job.title if a.job else "Job Deleted",
         'company': a.job.employer.company if a.job and a.job.employer else "N/A",
         'status': a.status,
-        'applied_at': a.applied_at.isoformat() if hasattr(a, 'applied_at') else None
+        'applied_at': a.applied_at.isoformat() if a.applied_at else None
     } for a in apps])
\ No newline at end of file
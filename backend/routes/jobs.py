@@ -1,8 +1,11 @@
 # backend/routes/jobs.py
 from flask import Blueprint, render_template, request, jsonify, current_app
 from flask_login import login_required, current_user
+from .. import analytics, dedup, geo
+from ..alerts import alert_matcher
 from ..app import db
 from ..models import Job, Employer
+from ..typeahead import typeahead
 from datetime import datetime
 
 jobs_bp = Blueprint('jobs', __name__, url_prefix='/jobs')
@@ -25,8 +28,14 @@ def post_job():
                 employer_id=current_user.id,
                 posted_at=datetime.utcnow()
             )
+            geo.locate_job(job)
             db.session.add(job)
+            db.session.flush()
+            dedup.index_job(job, current_app.config['DEDUP_THRESHOLD'])
+            analytics.record_job_posted(job)
             db.session.commit()
+            typeahead.job_added(job)
+            alert_matcher.submit(job.id)
             return jsonify(success=True, message="Job posted successfully!")
         except Exception as e:
             db.session.rollback()
@@ -36,7 +45,7 @@ def post_job():
 
 @jobs_bp.route('/api/jobs')
 def api_jobs():
-    jobs = Job.query.all()
+    jobs = Job.active().all()
     return jsonify([{
         'id': j.id,
         'title': j.title,
@@ -45,7 +54,7 @@ def api_jobs():
         'salary': j.salary,
         'category': j.category,
         'company': j.employer.company if j.employer else "Unknown",
-        'posted_at': j.posted_at.isoformat() if hasattr(j, 'posted_at') else None
+        'posted_at': j.posted_at.isoformat() if j.posted_at else None
     } for j in jobs])
 
 @jobs_bp.route('/employer/my_jobs')
@@ -63,5 +72,5 @@ def my_jobs():
         'location': j.location,
         'salary': j.salary,
         'category': j.category,
-        'posted_at': j.posted_at.isoformat() if hasattr(j, 'posted_at') else None
+        'posted_at': j.posted_at.isoformat() if j.posted_at else None
     } for j in jobs])
\ No newline at end of file
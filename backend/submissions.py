@@ -0,0 +1,74 @@
+# backend/submissions.py
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from . import analytics, counters
+from .models import db, Application, Job, IdempotencyKey
+
+
+def submit_applications(seeker_id, jobs):
+    """Apply ``seeker_id`` to each of ``jobs`` in one INSERT.
+
+    Relies on the unique (job_id, seeker_id) index with ``ON CONFLICT DO
+    NOTHING`` instead of a SELECT-then-INSERT, so concurrent double submits
+    cannot create duplicates.  Returns the ids of jobs that were newly
+    applied to; the caller commits.
+    """
+    if not jobs:
+        return set()
+    now = datetime.utcnow()
+    stmt = (
+        sqlite_insert(Application)
+        .values([
+            {'job_id': job.id, 'seeker_id': seeker_id, 'status': 'Applied', 'applied_at': now}
+            for job in jobs
+        ])
+        .on_conflict_do_nothing(index_elements=['job_id', 'seeker_id'])
+        .returning(Application.job_id)
+    )
+    inserted = set(db.session.execute(stmt).scalars())
+    counters.record_applications(inserted)
+    for job in jobs:
+        if job.id in inserted:
+            analytics.record_application(job.id, job.employer_id, now)
+    return inserted
+
+
+def active_jobs(job_ids):
+    return Job.active().filter(Job.id.in_(job_ids)).all() if job_ids else []
+
+
+def claim_idempotency_key(key, user_id, endpoint):
+    """Reserve ``key`` inside the current transaction.
+
+    Returns ``None`` when the key is new (the caller then does its work and
+    calls :func:`store_idempotent_response` before committing), or the
+    stored ``IdempotencyKey`` row when this is a retry.
+    """
+    stmt = (
+        sqlite_insert(IdempotencyKey)
+        .values(key=key, user_id=user_id, endpoint=endpoint, created_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=['key', 'user_id'])
+    )
+    if db.session.execute(stmt).rowcount:
+        return None
+    return db.session.get(IdempotencyKey, (key, user_id))
+
+
+def store_idempotent_response(key, user_id, status_code, body):
+    db.session.execute(
+        db.update(IdempotencyKey)
+        .where(IdempotencyKey.key == key, IdempotencyKey.user_id == user_id)
+        .values(status_code=status_code, response_body=body)
+    )
+
+
+def prune_idempotency_keys(max_age_hours=24):
+    cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+    result = db.session.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)
+    )
+    db.session.commit()
+    return result.rowcount
@@ -0,0 +1,195 @@
+# backend/typeahead.py
+import heapq
+import threading
+import time
+
+from .models import db, Job
+
+FIELDS = ('title', 'category', 'location')
+
+
+def normalize(value):
+    return ' '.join((value or '').lower().split())
+
+
+class _Node:
+    __slots__ = ('children', 'weight', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.weight = 0
+        self.top = []      # [(weight, key)] best completions below, heaviest first
+
+
+class PrefixIndex:
+    """Weighted prefix trie that caches the top-k completions at every node.
+
+    A lookup walks ``len(prefix)`` nodes and returns the cached list, so
+    queries cost the same however many terms share the prefix.  Memory is
+    bounded by ``max_terms`` distinct keys of at most ``max_length``
+    characters; once full, unseen terms are skipped until others are removed.
+    """
+
+    def __init__(self, k=10, max_terms=50000, max_length=60):
+        self.k = k
+        self.max_terms = max_terms
+        self.max_length = max_length
+        self.root = _Node()
+        self.display = {}  # key -> original spelling
+        self.skipped = 0
+
+    def __len__(self):
+        return len(self.display)
+
+    def add(self, value, delta=1):
+        key = normalize(value)[:self.max_length]
+        if not key:
+            return
+        if delta > 0 and key not in self.display:
+            if len(self.display) >= self.max_terms:
+                self.skipped += 1
+                return
+            self.display[key] = value.strip()[:self.max_length]
+
+        path = [self.root]
+        node = self.root
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                if delta <= 0:
+                    return
+                child = node.children[ch] = _Node()
+            path.append(child)
+            node = child
+
+        node.weight = max(node.weight + delta, 0)
+        if node.weight == 0:
+            self.display.pop(key, None)
+
+        for depth in range(len(path) - 1, -1, -1):
+            current = path[depth]
+            entries = [entry for entry in current.top if entry[1] != key]
+            if delta > 0:
+                if node.weight:
+                    entries.append((node.weight, key))
+                    entries.sort(reverse=True)
+                current.top = entries[:self.k]
+            elif len(entries) != len(current.top):
+                # The key dropped; a sibling branch may now rank higher.
+                self._recompute(current, key[:depth])
+            if (depth and not current.children and not current.weight):
+                del path[depth - 1].children[key[depth - 1]]
+
+    def _recompute(self, node, prefix):
+        candidates = []
+        if node.weight:
+            candidates.append((node.weight, prefix))
+        for child in node.children.values():
+            candidates.extend(child.top)
+        node.top = heapq.nlargest(self.k, candidates)
+
+    def remove(self, value):
+        self.add(value, -1)
+
+    def suggest(self, prefix, limit=None):
+        node = self.root
+        for ch in normalize(prefix):
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return [self.display[key] for _, key in node.top[:limit or self.k]]
+
+
+class TypeaheadService:
+    """Per-process suggestions for the job search boxes.
+
+    Indexes are built lazily from the active jobs, updated incrementally by
+    the job write routes in this worker, and rebuilt in the background every
+    ``TYPEAHEAD_REFRESH`` seconds to pick up other workers' writes and
+    expiries.
+    """
+
+    def __init__(self):
+        self._app = None
+        self._lock = threading.Lock()
+        self._indexes = None
+        self._built_at = 0.0
+        self._rebuilding = False
+
+    def init_app(self, app):
+        self._app = app
+        app.extensions['typeahead'] = self
+
+    def _build(self):
+        config = self._app.config
+        indexes = {
+            field: PrefixIndex(
+                max_terms=config['TYPEAHEAD_MAX_TERMS'],
+                max_length=config['TYPEAHEAD_MAX_LENGTH'],
+            )
+            for field in FIELDS
+        }
+        rows = db.session.query(Job.title, Job.category, Job.location).filter(
+            Job.is_active_clause()
+        ).yield_per(1000)
+        for row in rows:
+            for field, value in zip(FIELDS, row):
+                if value:
+                    indexes[field].add(value)
+        return indexes
+
+    def _refresh_in_background(self):
+        def run():
+            try:
+                with self._app.app_context():
+                    indexes = self._build()
+                    db.session.remove()
+                with self._lock:
+                    self._indexes = indexes
+                    self._built_at = time.monotonic()
+            finally:
+                self._rebuilding = False
+
+        self._rebuilding = True
+        threading.Thread(target=run, name='typeahead-rebuild', daemon=True).start()
+
+    def _ensure_index(self):
+        if self._indexes is None:
+            indexes = self._build()
+            with self._lock:
+                if self._indexes is None:
+                    self._indexes = indexes
+                    self._built_at = time.monotonic()
+        elif (not self._rebuilding and time.monotonic() - self._built_at
+                > self._app.config['TYPEAHEAD_REFRESH']):
+            self._refresh_in_background()
+
+    def suggest(self, field, prefix, limit=8):
+        self._ensure_index()
+        with self._lock:
+            return self._indexes[field].suggest(prefix, limit)
+
+    def _apply(self, values, delta):
+        if self._indexes is None:
+            return  # built from the database on first use
+        with self._lock:
+            for field, value in zip(FIELDS, values):
+                if value:
+                    self._indexes[field].add(value, delta)
+
+    def job_added(self, job):
+        self._apply(job_values(job), 1)
+
+    def job_removed(self, job):
+        self._apply(job_values(job), -1)
+
+    def job_changed(self, old_values, job):
+        self._apply(old_values, -1)
+        self._apply(job_values(job), 1)
+
+
+def job_values(job):
+    return tuple(getattr(job, field) for field in FIELDS)
+
+
+typeahead = TypeaheadService()
@@ -0,0 +1,111 @@
+# benchmarks/backup_bench.py
+"""Measure write latency while a snapshot is taken.
+
+Builds a scratch database of roughly ``--size-mb`` megabytes, starts a
+writer thread that commits one small insert every ``--interval`` seconds
+on its own connection, and reports commit latency with no backup running,
+during a stepped online backup (``backend.backup.online_copy``) and during
+a single-step copy, the way a plain ``.backup`` would run::
+
+    python benchmarks/backup_bench.py --size-mb 50 --journal-mode delete
+    python benchmarks/backup_bench.py --size-mb 50 --journal-mode wal
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.backup import online_copy  # noqa: E402
+
+
+def build_database(path, size_mb, journal_mode):
+    conn = sqlite3.connect(path)
+    conn.execute(f'PRAGMA journal_mode={journal_mode}')
+    # online_copy only accepts databases with the app's job table.
+    conn.execute('CREATE TABLE job (id INTEGER PRIMARY KEY, body TEXT)')
+    conn.execute('CREATE TABLE writes (id INTEGER PRIMARY KEY, at REAL)')
+    row = 'x' * 1000
+    conn.executemany('INSERT INTO job (body) VALUES (?)', ((row,) for _ in range(size_mb * 1000)))
+    conn.commit()
+    conn.close()
+
+
+class Writer(threading.Thread):
+    def __init__(self, path, interval):
+        super().__init__(daemon=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.interval = interval
+        self.latencies = []
+        self.running = True
+
+    def run(self):
+        while self.running:
+            started = time.perf_counter()
+            self.conn.execute('INSERT INTO writes (at) VALUES (?)', (started,))
+            self.conn.commit()
+            self.latencies.append(time.perf_counter() - started)
+            time.sleep(self.interval)
+
+    def take(self):
+        latencies, self.latencies = self.latencies, []
+        return latencies
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    if not latencies:
+        return {'writes': 0}
+    return {
+        'writes': len(latencies),
+        'p50_ms': round(statistics.median(latencies) * 1000, 2),
+        'p99_ms': round(latencies[min(len(latencies) - 1, math.ceil(0.99 * len(latencies)) - 1)] * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=50)
+    parser.add_argument('--journal-mode', choices=('delete', 'wal'), default='wal',
+                        help='wal is what `flask bootstrap` sets up.')
+    parser.add_argument('--interval', type=float, default=0.01,
+                        help='Seconds between writer commits.')
+    parser.add_argument('--pages', type=int, default=64)
+    parser.add_argument('--pause', type=float, default=0.005)
+    parser.add_argument('--baseline-seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        build_database(path, args.size_mb, args.journal_mode)
+        writer = Writer(path, args.interval)
+        writer.start()
+
+        results = {'size_mb': round(os.path.getsize(path) / 1e6, 1), 'journal_mode': args.journal_mode}
+        time.sleep(args.baseline_seconds)
+        results['idle'] = summarize(writer.take())
+
+        for name, pages in (('stepped', args.pages), ('single_step', -1)):
+            dest = os.path.join(tmp, f'{name}.db')
+            started = time.perf_counter()
+            restarts = online_copy(path, dest, pages=pages, pause=args.pause)
+            elapsed = time.perf_counter() - started
+            results[name] = dict(summarize(writer.take()), seconds=round(elapsed, 2), restarts=restarts)
+            os.unlink(dest)
+
+        writer.running = False
+        writer.join()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Measure cold start of a single worker.
+
+Each sample runs in a fresh interpreter so module imports are not cached:
+it times ``import backend``, ``create_app()`` and the first request to
+``/``.  Run after ``flask --app run bootstrap`` so the database exists::
+
+    python benchmarks/startup_bench.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER = r"""
+import json, time
+t0 = time.perf_counter()
+import backend
+t1 = time.perf_counter()
+app = backend.create_app()
+t2 = time.perf_counter()
+app.test_client().get('/')
+t3 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'create_app': t2 - t1,
+                  'first_request': t3 - t2, 'total': t3 - t0}))
+"""
+
+
+def sample():
+    out = subprocess.run(
+        [sys.executable, '-c', WORKER],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.runs)]
+    print(f'{"phase":<14}{"median ms":>12}{"max ms":>12}')
+    for phase in ('import', 'create_app', 'first_request', 'total'):
+        values = [s[phase] * 1000 for s in samples]
+        print(f'{phase:<14}{statistics.median(values):>12.1f}{max(values):>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import os
+import shlex
+import subprocess
+import sys
+
+# create_app() does no database I/O, so the app can be imported once in the
+# master and shared copy-on-write by every forked worker.
+preload_app = True
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+# Threaded workers so long-lived SSE streams (/my-applications/events) do
+# not each tie up a whole process.  A stream parks its thread on a queue,
+# so threads are cheap; SSE_MAX_STREAMS (24) of them may hold streams and
+# the rest are left for ordinary requests.
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
+bind = '0.0.0.0:' + os.environ.get('PORT', '8000')
+
+
+def on_starting(server):
+    # Per-worker metric files from a previous run would otherwise be summed
+    # into this run's counters.
+    from backend.metrics import DEFAULT_DIRECTORY, clear_directory
+    clear_directory(DEFAULT_DIRECTORY)
+
+# Scheduled maintenance runs beside the web server instead of as separate
+# Procfile processes: those get their own container on most platforms and
+# could not see this instance's SQLite file (on Render, /tmp/job_board.db).
+# Set RUN_MAINTENANCE=0 to run them elsewhere against a shared disk.
+MAINTENANCE_COMMANDS = [
+    'archive-jobs --every 600',
+    'backup-db --every 3600',
+]
+_maintenance = []
+
+
+def when_ready(server):
+    if os.environ.get('RUN_MAINTENANCE', '1') != '1':
+        return
+    for command in MAINTENANCE_COMMANDS:
+        _maintenance.append(subprocess.Popen(
+            [sys.executable, '-m', 'flask', '--app', 'run', *shlex.split(command)]
+        ))
+
+
+def on_exit(server):
+    for proc in _maintenance:
+        proc.terminate()
+    for proc in _maintenance:
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
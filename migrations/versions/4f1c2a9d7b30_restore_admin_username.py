@@ -0,0 +1,60 @@
+"""Restore username on Admin
+
+The app logs admins in (and seeds the default admin) by ``username``, and
+databases built with ``db.create_all()`` match the initial schema.  This
+brings the migration head back in line with ``backend/models.py`` so that
+``flask bootstrap`` can drive every environment through Alembic.
+
+Revision ID: 4f1c2a9d7b30
+Revises: e985b7ae5cee
+Create Date: 2026-10-19 09:12:41.118220
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f1c2a9d7b30'
+down_revision = 'e985b7ae5cee'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('admin', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('username', sa.String(length=50), nullable=True))
+
+    op.execute("UPDATE admin SET username = email WHERE username IS NULL")
+
+    with op.batch_alter_table('admin', schema=None) as batch_op:
+        batch_op.alter_column('username',
+               existing_type=sa.String(length=50),
+               nullable=False)
+        batch_op.alter_column('password',
+               existing_type=sa.String(length=150),
+               type_=sa.String(length=200),
+               existing_nullable=False)
+        batch_op.create_unique_constraint('uq_admin_username', ['username'])
+        batch_op.drop_column('email')
+        batch_op.drop_column('name')
+
+
+def downgrade():
+    with op.batch_alter_table('admin', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('name', sa.String(length=150), nullable=True))
+        batch_op.add_column(sa.Column('email', sa.String(length=150), nullable=True))
+
+    op.execute("UPDATE admin SET email = username WHERE email IS NULL")
+
+    with op.batch_alter_table('admin', schema=None) as batch_op:
+        batch_op.alter_column('email',
+               existing_type=sa.String(length=150),
+               nullable=False)
+        batch_op.alter_column('password',
+               existing_type=sa.String(length=200),
+               type_=sa.String(length=150),
+               existing_nullable=False)
+        batch_op.create_unique_constraint('uq_admin_email', ['email'])
+        batch_op.drop_constraint('uq_admin_username', type_='unique')
+        batch_op.drop_column('username')
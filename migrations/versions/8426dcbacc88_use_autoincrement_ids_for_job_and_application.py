@@ -0,0 +1,62 @@
+"""Use AUTOINCREMENT ids for job and application
+
+Revision ID: 8426dcbacc88
+Revises: 1750ce042670
+Create Date: 2026-10-19 13:20:11.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8426dcbacc88'
+down_revision = '1750ce042670'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite can only add AUTOINCREMENT by rebuilding the table.
+    with op.batch_alter_table('job', schema=None, recreate='always',
+                              table_kwargs={'sqlite_autoincrement': True}) as batch_op:
+        pass
+
+    with op.batch_alter_table('application', schema=None, recreate='always',
+                              table_kwargs={'sqlite_autoincrement': True}) as batch_op:
+        pass
+
+    # Ids already archived (and possibly referenced by rollups, alerts and
+    # events) must not be handed out again either.
+    op.execute("""
+        INSERT INTO sqlite_sequence (name, seq)
+        SELECT 'job', max(coalesce((SELECT max(id) FROM job), 0),
+                          coalesce((SELECT max(job_id) FROM job_archive), 0))
+        WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'job')
+    """)
+    op.execute("""
+        UPDATE sqlite_sequence
+        SET seq = max(seq, coalesce((SELECT max(job_id) FROM job_archive), 0))
+        WHERE name = 'job'
+    """)
+    op.execute("""
+        INSERT INTO sqlite_sequence (name, seq)
+        SELECT 'application', max(coalesce((SELECT max(id) FROM application), 0),
+                                  coalesce((SELECT max(application_id) FROM application_archive), 0))
+        WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'application')
+    """)
+    op.execute("""
+        UPDATE sqlite_sequence
+        SET seq = max(seq, coalesce((SELECT max(application_id) FROM application_archive), 0))
+        WHERE name = 'application'
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('application', schema=None, recreate='always',
+                              table_kwargs={'sqlite_autoincrement': False}) as batch_op:
+        pass
+
+    with op.batch_alter_table('job', schema=None, recreate='always',
+                              table_kwargs={'sqlite_autoincrement': False}) as batch_op:
+        pass
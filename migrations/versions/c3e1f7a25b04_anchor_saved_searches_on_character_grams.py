@@ -0,0 +1,74 @@
+"""Anchor saved searches on character grams
+
+Revision ID: c3e1f7a25b04
+Revises: 8426dcbacc88
+Create Date: 2026-10-19 14:02:37.615204
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e1f7a25b04'
+down_revision = '8426dcbacc88'
+branch_labels = None
+depends_on = None
+
+# Frozen copies of the anchor rules at each revision, so this migration
+# does not change when backend.alerts does.
+LETTER_FREQUENCY = 'etaoinshrdlcumwfgypbvkjxqz'
+STOPWORDS = frozenset({'a', 'an', 'and', 'at', 'for', 'in', 'of', 'on', 'or', 'the', 'to', 'with'})
+
+
+def _rarity(gram):
+    return sum(0 if ch.isspace() else
+               LETTER_FREQUENCY.index(ch) if ch in LETTER_FREQUENCY else len(LETTER_FREQUENCY)
+               for ch in gram)
+
+
+def gram_anchor(q, category, location):
+    for prefix, value in (('q:', q), ('c:', category), ('l:', location)):
+        value = (value or '').lower().strip()
+        if value:
+            n = min(len(value), 3)
+            grams = {value[i:i + n] for i in range(len(value) - n + 1)}
+            return prefix + max(grams, key=lambda g: (_rarity(g), g))
+    return '*'
+
+
+def word_anchor(q, category, location):
+    for prefix, value in (('q:', q), ('c:', category), ('l:', location)):
+        tokens = {t for t in re.findall(r'[a-z0-9+#]+', (value or '').lower())
+                  if len(t) > 1 and t not in STOPWORDS}
+        if tokens:
+            return prefix + max(tokens, key=lambda t: (len(t), t))
+    return '*'
+
+
+def _reanchor(anchor_for):
+    saved_search = sa.table(
+        'saved_search',
+        sa.column('id', sa.Integer), sa.column('q', sa.String),
+        sa.column('category', sa.String), sa.column('location', sa.String),
+        sa.column('anchor', sa.String),
+    )
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(
+        saved_search.c.id, saved_search.c.q, saved_search.c.category, saved_search.c.location
+    )).all()
+    for row in rows:
+        conn.execute(
+            saved_search.update().where(saved_search.c.id == row.id)
+            .values(anchor=anchor_for(row.q, row.category, row.location))
+        )
+
+
+def upgrade():
+    _reanchor(gram_anchor)
+
+
+def downgrade():
+    _reanchor(word_anchor)
@@ -25,7 +25,7 @@ def upgrade():
                existing_type=sa.VARCHAR(length=200),
                type_=sa.String(length=150),
                existing_nullable=False)
-        batch_op.create_unique_constraint(None, ['email'])
+        batch_op.create_unique_constraint('uq_admin_email', ['email'])
         batch_op.drop_column('username')
 
     # ### end Alembic commands ###
@@ -35,7 +35,7 @@ def downgrade():
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('admin', schema=None) as batch_op:
         batch_op.add_column(sa.Column('username', sa.VARCHAR(length=50), nullable=False))
-        batch_op.drop_constraint(None, type_='unique')
+        batch_op.drop_constraint('uq_admin_email', type_='unique')
         batch_op.alter_column('password',
                existing_type=sa.String(length=150),
                type_=sa.VARCHAR(length=200),
@@ -1,7 +1,10 @@
-# run.py
 from backend import create_app
 
 app = create_app()
 
 if __name__ == '__main__':
+    from backend.cli import bootstrap_database
+
+    with app.app_context():
+        bootstrap_database()
     app.run(debug=True)